@@ -5,9 +5,21 @@ zeigt die gefundenen Linter-Fehler an und ermöglicht (mit Hilfe eines GPT-Model
 einen automatischen Code-Fix.
 """
 
+import io
 import os
+import re
 import sys
+import argparse
+import json
+import hashlib
+import functools
+import itertools
+import pathlib
+import shutil
 import subprocess
+import tempfile
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 
 # Initialisiere den OpenAI-Client.
@@ -16,33 +28,91 @@ client = OpenAI()
 
 STEP_FILENAME = "lintstep.txt"
 
-EXCLUDE_PATHS = [
-    os.sep + ".git" + os.sep,
-    os.sep + "__pycache__" + os.sep,
-    os.sep + "build" + os.sep,
-    os.sep + "dist" + os.sep,
-    os.sep + "docs" + os.sep,
-    os.sep + "venv" + os.sep,
-    os.sep + "ops" + os.sep,
-]
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "autolint")
+LINT_CACHE_FILENAME = os.path.join(CACHE_DIR, "index.json")
+GPT_CACHE_DIR = os.path.join(CACHE_DIR, "gpt")
+
+GPT_MODEL = "gpt-4o-mini"
+
+# Dateipfade und Modul-Kopfzeilen unterscheiden sonst identische Meldungen.
+_LINT_PATH_RE = re.compile(r"^[^\n:]+:(?=\d+:\d+:)", re.MULTILINE)
+_LINT_MODULE_RE = re.compile(r"^\*+ Module .*\n?", re.MULTILINE)
+_DUPLICATE_CODE_RE = re.compile(r"^.*duplicate-code.*\n?", re.MULTILINE)
+_LINT_LINE_RE = re.compile(r"^(?:[^\n:]+:)?(\d+):\d+:", re.MULTILINE)
+_LINT_CODE_RE = re.compile(r": ([CWERF]\d{4}):")
+_WINDOW_HEADER_RE = re.compile(r"^--- Zeilen (\d+)-(\d+) ---\n?", re.MULTILINE)
+
+# Meldungen, die sich ohne GPT-Modell deterministisch beheben lassen:
+# trailing-whitespace, missing-final-newline, trailing-newlines.
+LOCAL_FIXES = frozenset({"C0303", "C0304", "C0305"})
+
+# Anzahl der Kontextzeilen vor und nach jeder gemeldeten Zeile.
+CONTEXT_LINES = 5
+
+GPT_SYSTEM_PROMPT = (
+    "You are a pythoncode linter and fixer. You will fix the linter "
+    "problems and return the code with the last line empty. Do not add "
+    "any additional characters or explanations or backticks - just "
+    "return the fixed code."
+)
+GPT_WINDOW_SYSTEM_PROMPT = (
+    "You are a pythoncode linter and fixer. You receive excerpts of a file, "
+    "each introduced by a header line '--- Zeilen A-B ---'. Fix the linter "
+    "problems and return every excerpt with its unchanged header line "
+    "followed by the fixed code of that excerpt. Do not add any additional "
+    "characters or explanations or backticks."
+)
+
+EXCLUDE_DIRS = frozenset({
+    ".git",
+    "__pycache__",
+    "build",
+    "dist",
+    "docs",
+    "venv",
+    "ops",
+})
+
+
+def iter_python_files(root="."):
+    """
+    Liefert nacheinander die Pfade aller Python-Dateien unterhalb von `root`,
+    die nicht in ausgeschlossenen Unterverzeichnissen liegen.
+
+    Die Dateien werden erzeugt, während das Verzeichnis durchlaufen wird; es
+    entsteht keine vollständige Liste. Die Reihenfolge ist stabil: innerhalb
+    eines Verzeichnisses alphabetisch, zuerst die Dateien, dann die
+    Unterverzeichnisse. os.scandir liefert den Eintragstyp direkt aus dem
+    Verzeichniseintrag, sodass kein zusätzlicher stat-Aufruf pro Eintrag
+    nötig ist, und ausgeschlossene Verzeichnisse werden gar nicht erst
+    betreten. Die häufig benutzten Namen sind als lokale Variablen gebunden.
+    """
+    scandir = os.scandir
+    exclude_dirs = EXCLUDE_DIRS
+    pending_dirs = [root]
+    pop_dir = pending_dirs.pop
+    push_dirs = pending_dirs.extend
+    while pending_dirs:
+        with scandir(pop_dir()) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name not in exclude_dirs:
+                    subdirs.append(entry.path)
+            elif name.endswith(".py") and entry.is_file():
+                yield entry.path
+        push_dirs(reversed(subdirs))
 
 
 def list_python_files(root="."):
     """
     Durchsuche rekursiv das Verzeichnis `root` nach allen Python-Dateien,
-    die nicht in ausgeschlossenen Unterverzeichnissen liegen.
+    die nicht in ausgeschlossenen Unterverzeichnissen liegen, und liefere
+    sie in der Reihenfolge von iter_python_files als Liste.
     """
-    py_files = []
-    for dirpath, _dirnames, filenames in os.walk(root):
-        if any(exclude in dirpath for exclude in EXCLUDE_PATHS):
-            continue
-        for filename in filenames:
-            if filename.endswith(".py"):
-                full_path = os.path.join(dirpath, filename)
-                if not any(exclude in full_path for exclude in EXCLUDE_PATHS):
-                    py_files.append(full_path)
-    py_files.sort()
-    return py_files
+    return list(iter_python_files(root))
 
 
 def load_last_processed_file() -> str:
@@ -59,25 +129,137 @@ def save_current_file(file_path: str) -> None:
         f.write(file_path)
 
 
+def get_pylint_version() -> str:
+    """Ermittelt die installierte pylint-Version (Teil des Cache-Schlüssels)."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return "unknown"
+    try:
+        return version("pylint")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def lint_cache_key(file_path: str, code: bytes, pylint_version: str) -> str:
+    """
+    Bildet den Cache-Schlüssel aus Pfad, Dateiinhalt und pylint-Version.
+
+    Der Schlüssel hängt nur vom Inhalt ab, nicht von der mtime, sodass ein
+    `touch` den Cache nicht invalidiert.
+    """
+    digest = hashlib.sha256(file_path.encode("utf-8") + b"\0" + code)
+    return f"{digest.hexdigest()}:{pylint_version}"
+
+
+def load_lint_cache() -> dict:
+    """Lade den persistenten pylint-Cache, falls vorhanden."""
+    try:
+        with open(LINT_CACHE_FILENAME, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_lint_cache(cache: dict) -> None:
+    """Speichere den persistenten pylint-Cache."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(LINT_CACHE_FILENAME, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"pylint-Cache konnte nicht gespeichert werden: {e}")
+
+
 def run_pylint(file_path: str) -> str:
     """
     Führt pylint für die angegebene Datei aus und liefert die Ausgabe
     als String zurück.
+
+    Die Ausgabe wird zeilenweise gelesen; sobald die perfekte Bewertung
+    erscheint, wird pylint beendet, ohne den Rest des Berichts abzuwarten.
     """
+    output = io.StringIO()
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             ["pylint", file_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        ) as process:
+            for line in process.stdout:
+                output.write(line)
+                if "rated at 10.00/10" in line:
+                    process.terminate()
+                    break
+        return output.getvalue()
+    except FileNotFoundError:
+        print(
+            "pylint wurde nicht gefunden. Bitte installiere pylint "
+            "und stelle sicher, dass es im PATH ist."
+        )
+        return ""
+
+
+def format_lint_messages(messages: list) -> str:
+    """
+    Formatiert die JSON-Meldungen von pylint im gewohnten Textformat
+    (`pfad:zeile:spalte: id: meldung (symbol)`).
+    """
+    lines = []
+    module = None
+    for msg in messages:
+        if msg["module"] != module:
+            module = msg["module"]
+            lines.append(f"************* Module {module}")
+        lines.append(
+            f"{msg['path']}:{msg['line']}:{msg['column']}: "
+            f"{msg['message-id']}: {msg['message']} ({msg['symbol']})"
+        )
+    return "\n".join(lines)
+
+
+def run_pylint_batch(file_paths: list) -> dict:
+    """
+    Führt pylint einmalig und parallel (`-j 0`) für alle angegebenen Dateien aus.
+
+    Liefert ein Dictionary `{pfad: lint_ausgabe}`; Dateien ohne Meldungen
+    erhalten einen leeren String. Schlägt der Aufruf fehl (fataler Fehler,
+    Aufruffehler, abgebrochener Prozess oder leere Ausgabe), wird ein leeres
+    Dictionary zurückgegeben, damit keine Datei fälschlich als sauber gilt
+    und im Cache landet.
+    """
+    if not file_paths:
+        return {}
+    try:
+        result = subprocess.run(
+            ["pylint", "-j", "0", "--output-format=json", *file_paths],
             capture_output=True,
             text=True,
             check=False
         )
-        return result.stdout + "\n" + result.stderr
     except FileNotFoundError:
         print(
             "pylint wurde nicht gefunden. Bitte installiere pylint "
             "und stelle sicher, dass es im PATH ist."
         )
-        return ""
+        return {}
+    # Bit 1 meldet einen fatalen Fehler, Bit 32 einen Aufruffehler; ein
+    # negativer Rückgabewert einen durch ein Signal beendeten Prozess.
+    if result.returncode < 0 or result.returncode & (1 | 32) or not result.stdout.strip():
+        return {}
+    try:
+        messages = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        return {}
+    by_path = {os.path.normpath(path): [] for path in file_paths}
+    for msg in messages:
+        by_path.setdefault(os.path.normpath(msg["path"]), []).append(msg)
+    return {
+        path: format_lint_messages(by_path[os.path.normpath(path)])
+        for path in file_paths
+    }
 
 
 def filter_lint_messages(lint_output: str) -> str:
@@ -85,52 +267,270 @@ def filter_lint_messages(lint_output: str) -> str:
     Filtert aus der pylint-Ausgabe alle Zeilen, die 'duplicate-code'
     enthalten und gibt den Rest als zusammengefassten String zurück.
     """
-    filtered_lines = []
-    for line in lint_output.splitlines():
-        if "duplicate-code" not in line:
-            filtered_lines.append(line)
-    return "\n".join(filtered_lines)
+    return _DUPLICATE_CODE_RE.sub("", lint_output)
+
+
+def is_clean(lint_output: str) -> bool:
+    """Prüft, ob die pylint-Ausgabe keine relevanten Linter-Fehler enthält."""
+    if "Your code has been rated at 10.00/10" in lint_output:
+        return True
+    return not filter_lint_messages(lint_output).strip()
+
+
+def prefilter_files(file_paths: list) -> list:
+    """
+    Lintert alle Dateien vorab und liefert nur diejenigen als Liste von
+    `(pfad, lint_ausgabe, code)` zurück, die relevante Linter-Fehler enthalten.
+    Jede Datei wird dabei genau einmal eingelesen.
+
+    Unveränderte Dateien werden aus dem persistenten Cache beantwortet.
+    Dateien, die der gebündelte pylint-Lauf nicht abdeckt, werden einzeln,
+    aber parallel nachgelintert.
+    """
+    cache = load_lint_cache()
+    pylint_version = get_pylint_version()
+    codes = {path: pathlib.Path(path).read_bytes() for path in file_paths}
+    keys = {
+        path: lint_cache_key(path, code, pylint_version)
+        for path, code in codes.items()
+    }
+    lint_outputs = {
+        path: cache[key] for path, key in keys.items() if key in cache
+    }
+    uncached = [path for path in file_paths if path not in lint_outputs]
+    if uncached:
+        fresh = run_pylint_batch(uncached)
+        missing = [path for path in uncached if path not in fresh]
+        if missing:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                # Eine leere Ausgabe bedeutet hier, dass pylint fehlt.
+                fresh.update(
+                    (path, output)
+                    for path, output in zip(missing, executor.map(run_pylint, missing))
+                    if output
+                )
+        cache.update((keys[path], output) for path, output in fresh.items())
+        save_lint_cache(cache)
+        lint_outputs.update(fresh)
+        lint_outputs.update((path, "") for path in uncached if path not in fresh)
+    return [
+        (path, lint_outputs[path], codes[path].decode("utf-8"))
+        for path in file_paths
+        if not is_clean(lint_outputs[path])
+    ]
 
 
 def get_code_from_file(file_path: str) -> str:
     """Lese den kompletten Inhalt der Datei ein."""
-    with open(file_path, "r", encoding="utf-8") as f:
-        return f.read()
+    return pathlib.Path(file_path).read_text(encoding="utf-8")
+
+
+def write_code_to_file(file_path: str, code: str) -> None:
+    """
+    Schreibe den Code atomar in die Datei: zuerst in eine temporäre Datei im
+    selben Verzeichnis, die die Zugriffsrechte des Originals übernimmt und
+    anschließend per os.replace an seine Stelle tritt. Schlägt ein Schritt
+    fehl, wird die temporäre Datei wieder entfernt.
+    """
+    directory, name = os.path.split(os.path.abspath(file_path))
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=directory, prefix=name + ".", suffix=".tmp", delete=False
+    ) as tmp:
+        tmp_path = tmp.name
+        try:
+            tmp.write(code)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp_path)
+            raise
+    try:
+        shutil.copymode(file_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def ensure_ends_with_empty_line(code: str) -> str:
     """Stellt sicher, dass der Code mit einer leeren Zeile endet."""
-    if not code.endswith("\n"):
-        code += "\n"
-    lines = code.splitlines()
-    if lines and lines[-1].strip() != "":
-        code += "\n"
-    return code
+    if code.endswith("\n\n"):
+        return code
+    return code.rstrip("\n") + "\n\n"
+
+
+def string_line_numbers(code: str):
+    """
+    Liefert die Nummern (1-basiert) der Zeilen, deren Zeilenende innerhalb
+    eines mehrzeiligen String-Tokens liegt, oder None, falls sich der Code
+    nicht tokenisieren lässt.
+    """
+    line_numbers = set()
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(code).readline):
+            line_numbers.update(range(token.start[0], token.end[0]))
+    except (tokenize.TokenError, SyntaxError):
+        return None
+    return line_numbers
+
+
+def can_fix_locally(lint_message: str, code: str) -> bool:
+    """
+    Prüft, ob sich alle gemeldeten Linter-Fehler mit fix_locally beheben lassen.
+    Code, der sich nicht tokenisieren lässt, geht an das GPT-Modell.
+    """
+    codes = set(_LINT_CODE_RE.findall(lint_message))
+    return bool(codes) and codes <= LOCAL_FIXES and string_line_numbers(code) is not None
+
+
+def fix_locally(code: str) -> str:
+    """
+    Behebt die Meldungen aus LOCAL_FIXES ohne GPT-Modell: entfernt
+    Leerzeichen und Tabulatoren am Zeilenende und sorgt für genau einen
+    Zeilenumbruch am Dateiende. Zeilen werden nur an "\\n" getrennt, die
+    Zeilenenden (auch CRLF) bleiben erhalten, und Zeilen innerhalb
+    mehrzeiliger Strings werden nicht verändert.
+    """
+    protected = string_line_numbers(code) or set()
+    lines = code.split("\n")
+    for line_no, line in enumerate(lines, start=1):
+        if line_no in protected:
+            continue
+        cr = "\r" if line.endswith("\r") else ""
+        lines[line_no - 1] = line[:len(line) - len(cr)].rstrip(" \t\v") + cr
+    newline = "\r\n" if "\r\n" in code else "\n"
+    return "\n".join(lines).rstrip("\r\n") + newline
+
+
+def canonicalize_lint_messages(lint_message: str) -> str:
+    """
+    Entfernt Dateipfade und Modul-Kopfzeilen aus den Linter-Meldungen, sodass
+    identischer Code in verschiedenen Dateien dieselbe GPT-Anfrage erzeugt.
+    """
+    return _LINT_MODULE_RE.sub("", _LINT_PATH_RE.sub("", lint_message)).strip()
+
+
+def gpt_cache_key(model: str, system_prompt: str, content: str) -> str:
+    """Bildet den Cache-Schlüssel für eine GPT-Anfrage aus Modell und Prompt."""
+    payload = "\0".join((model, system_prompt, content)).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def load_gpt_response(key: str):
+    """Lade eine zwischengespeicherte GPT-Antwort oder None, falls keine vorliegt."""
+    try:
+        with open(os.path.join(GPT_CACHE_DIR, key), "r", encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def save_gpt_response(key: str, response: str) -> None:
+    """Speichere eine GPT-Antwort im persistenten Cache."""
+    try:
+        os.makedirs(GPT_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(GPT_CACHE_DIR, key), "w", encoding="utf-8") as f:
+            f.write(response)
+    except OSError as e:
+        print(f"GPT-Antwort konnte nicht zwischengespeichert werden: {e}")
 
 
 def call_gpt_model(code: str, lint_message: str) -> str:
     """
     Ruft das GPT-Modell auf mit dem gesamten Code und den Linter-Fehlern,
     und liefert den (verbesserten) Code als Antwort zurück.
+
+    Die Meldungen werden vorher kanonisiert, damit gleiche Anfragen aus
+    verschiedenen Dateien nur einmal an das Modell gehen.
     """
     content = (
         "Hier ist der komplette Code:\n\n" + code + "\n\n" +
-        "Folgende Linter-Fehler wurden festgestellt:\n\n" + lint_message +
+        "Folgende Linter-Fehler wurden festgestellt:\n\n" +
+        canonicalize_lint_messages(lint_message) +
         "\n\nBitte aktualisiere den Code basierend darauf. Achte darauf, dass "
         "die letzte Zeile des Codes leer ist."
     )
+    return _ask_gpt_model(GPT_SYSTEM_PROMPT, content)
+
+
+def get_context_windows(lint_message: str, line_count: int) -> list:
+    """
+    Ermittelt die Zeilenbereiche (1-basiert, inklusive) um alle gemeldeten
+    Zeilen herum; überlappende Bereiche werden zusammengefasst.
+    """
+    windows = []
+    line_numbers = sorted({int(n) for n in _LINT_LINE_RE.findall(lint_message)})
+    for line_no in line_numbers:
+        start = max(1, line_no - CONTEXT_LINES)
+        end = min(line_count, line_no + CONTEXT_LINES)
+        if start > end:
+            continue
+        if windows and start <= windows[-1][1] + 1:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((start, end))
+    return windows
+
+
+def call_gpt_model_windows(code: str, lint_message: str):
+    """
+    Schickt dem GPT-Modell nur die Zeilenbereiche um die gemeldeten Zeilen
+    und setzt die korrigierten Bereiche wieder in den Code ein.
+
+    Liefert den vollständigen aktualisierten Code oder None, wenn sich die
+    Meldungen keinen Zeilen zuordnen lassen oder die Antwort nicht zu den
+    angefragten Bereichen passt.
+
+    Zeilen werden wie bei pylint nur an "\\n" getrennt; die Zeilenenden
+    (auch CRLF) bleiben erhalten, eingesetzte Zeilen übernehmen den
+    Zeilenumbruch der Datei.
+    """
+    lines = code.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    windows = get_context_windows(lint_message, len(lines))
+    if not windows:
+        return None
+    cr = "\r" if "\r\n" in code else ""
+    blocks = [
+        f"--- Zeilen {start}-{end} ---\n"
+        + "\n".join(line.removesuffix("\r") for line in lines[start - 1:end])
+        for start, end in windows
+    ]
+    content = (
+        "Hier sind Ausschnitte aus dem Code:\n\n" + "\n".join(blocks) + "\n\n" +
+        "Folgende Linter-Fehler wurden festgestellt:\n\n" +
+        canonicalize_lint_messages(lint_message) +
+        "\n\nBitte aktualisiere die Ausschnitte basierend darauf."
+    )
+    answer = _ask_gpt_model(GPT_WINDOW_SYSTEM_PROMPT, content)
+    parts = _WINDOW_HEADER_RE.split(answer)[1:]
+    fixed = {
+        (int(parts[i]), int(parts[i + 1])): parts[i + 2].rstrip("\n")
+        for i in range(0, len(parts) - 2, 3)
+    }
+    if set(fixed) != set(windows):
+        return None
+    for start, end in reversed(windows):
+        lines[start - 1:end] = [line + cr for line in fixed[(start, end)].split("\n")]
+    return "\n".join(lines) + "\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _ask_gpt_model(system_prompt: str, content: str) -> str:
+    """
+    Führt die eigentliche GPT-Anfrage aus.
+
+    Antworten werden im Speicher und unter GPT_CACHE_DIR zwischengespeichert,
+    sodass dieselbe Anfrage das Modell nur einmal erreicht.
+    """
+    key = gpt_cache_key(GPT_MODEL, system_prompt, content)
+    cached = load_gpt_response(key)
+    if cached is not None:
+        return cached
     response = client.chat.completions.create(
-        model="gpt-4o-mini",
+        model=GPT_MODEL,
         messages=[
-            {
-                "role": "developer",
-                "content": (
-                    "You are a pythoncode linter and fixer. You will fix the linter "
-                    "problems and return the code with the last line empty. Do not add "
-                    "any additional characters or explanations or backticks - just "
-                    "return the fixed code."
-                )
-            },
+            {"role": "developer", "content": system_prompt},
             {"role": "user", "content": content}
         ],
         response_format={"type": "text"},
@@ -141,24 +541,35 @@ def call_gpt_model(code: str, lint_message: str) -> str:
         presence_penalty=0,
         store=False
     )
-    return response.choices[0].message.content.strip()
+    answer = response.choices[0].message.content.strip()
+    if answer:
+        save_gpt_response(key, answer)
+    return answer
 
 
-def process_file(file_path: str) -> bool:
+def process_file(file_path: str, lint_output: str = None, code: str = None,
+                 full_file: bool = False) -> bool:
     """
     Lintert die Datei, zeigt die Linter-Fehler an und fragt interaktiv:
-      1: Autofix via GPT-Modell
+      1: Autofix (lokal für reine Whitespace-Meldungen, sonst via GPT-Modell)
       2: Datei überspringen
       3: Script beenden
 
     Falls die Datei bereits mit „Your code has been rated at 10.00/10“
     gewertet wurde, wird sie automatisch übersprungen.
+    Liegt bereits eine Ausgabe aus dem gebündelten pylint-Lauf vor
+    (`lint_output`), wird pylint nicht erneut gestartet; ebenso wird die
+    Datei nicht erneut eingelesen, wenn ihr Inhalt (`code`) übergeben wird.
+    Beim Autofix werden nur die Zeilen um die Meldungen herum an das Modell
+    geschickt, außer `full_file` ist gesetzt oder die Ausschnitte lassen sich
+    nicht zurückführen.
     Gibt True zurück, wenn die Verarbeitung fortgesetzt werden soll,
     oder False, wenn das Script beendet wird.
     """
     print(f"\nDatei: {file_path}")
     save_current_file(file_path)
-    lint_output = run_pylint(file_path)
+    if lint_output is None:
+        lint_output = run_pylint(file_path)
 
     # Prüfe, ob der perfekte Rating-String vorhanden ist.
     if "Your code has been rated at 10.00/10" in lint_output:
@@ -179,15 +590,22 @@ def process_file(file_path: str) -> bool:
         ).strip()
 
     if user_choice == "1":
-        print("Rufe das GPT-Modell auf...")
-        original_code = get_code_from_file(file_path)
-        updated_code = call_gpt_model(original_code, lint_messages)
-        updated_code = ensure_ends_with_empty_line(updated_code)
+        original_code = code if code is not None else get_code_from_file(file_path)
+        if can_fix_locally(lint_messages, original_code):
+            print("Behebe die Linter-Fehler lokal...")
+            updated_code = fix_locally(original_code)
+        else:
+            print("Rufe das GPT-Modell auf...")
+            updated_code = None
+            if not full_file:
+                updated_code = call_gpt_model_windows(original_code, lint_messages)
+            if updated_code is None:
+                updated_code = call_gpt_model(original_code, lint_messages)
+            updated_code = ensure_ends_with_empty_line(updated_code)
         if updated_code.strip() == "":
             print("Das GPT-Modell hat keinen aktualisierten Code geliefert.")
         else:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(updated_code)
+            write_code_to_file(file_path, updated_code)
             print(f"Datei '{file_path}' wurde geupgradet.")
         return True
     elif user_choice == "2":
@@ -198,19 +616,37 @@ def process_file(file_path: str) -> bool:
         return False
 
 
+def parse_args():
+    """Liest die Kommandozeilenoptionen ein."""
+    parser = argparse.ArgumentParser(
+        description="Lintert das Projekt und behebt Linter-Fehler mit einem GPT-Modell."
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Immer den kompletten Dateiinhalt statt Ausschnitten an das Modell schicken",
+    )
+    return parser.parse_args()
+
+
 def main():
-    py_files = list_python_files(".")
+    args = parse_args()
+    files = iter_python_files(".")
+    last_processed = load_last_processed_file()
+    if last_processed:
+        files = itertools.dropwhile(lambda path: path != last_processed, files)
+        next(files, None)
+    py_files = list(files)
     if not py_files:
         print("Keine Python-Dateien gefunden.")
         sys.exit(0)
-    last_processed = load_last_processed_file()
-    start_processing = (last_processed == "")
-    for file_path in py_files:
-        if not start_processing:
-            if file_path == last_processed:
-                start_processing = True
-            continue
-        continue_processing = process_file(file_path)
+    pending = prefilter_files(py_files)
+    print(
+        f"{len(py_files) - len(pending)} von {len(py_files)} Dateien ohne "
+        "relevante Linter-Fehler werden übersprungen."
+    )
+    for file_path, lint_output, code in pending:
+        continue_processing = process_file(file_path, lint_output, code, args.full)
         if not continue_processing:
             break
 
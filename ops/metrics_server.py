@@ -10,7 +10,7 @@ import argparse
 import logging
 import signal
 import sys
-import time
+import threading
 from prometheus_client import start_http_server
 
 # Configure logging for production-grade output.
@@ -40,10 +40,10 @@ def parse_args():
     return parser.parse_args()
 
 
-def setup_signal_handlers():
+def setup_signal_handlers(shutdown_event):
     def shutdown_handler(sig, frame):
         logger.info("Received signal %s, shutting down metrics server...", sig)
-        sys.exit(0)
+        shutdown_event.set()
 
     signal.signal(signal.SIGINT, shutdown_handler)
     signal.signal(signal.SIGTERM, shutdown_handler)
@@ -58,11 +58,11 @@ def main():
         logger.error("Failed to start metrics server: %s", e)
         sys.exit(1)
 
-    setup_signal_handlers()
+    shutdown_event = threading.Event()
+    setup_signal_handlers(shutdown_event)
 
-    # Keep the process alive to serve metrics.
-    while True:
-        time.sleep(1)
+    # Block until SIGINT/SIGTERM arrives; no periodic wakeups while idle.
+    shutdown_event.wait()
 
 
 if __name__ == "__main__":
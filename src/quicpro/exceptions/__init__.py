@@ -9,7 +9,7 @@ from .pipeline_error import PipelineError
 from .connection_errors import QuicConnectionError
 from .encoding_error import EncodingError
 from .encryption_error import EncryptionError
-from .transmission_error import TransmissionError
+from .transmission_error import TransmissionError, PartialTransmissionError
 from .decryption_error import DecryptionError
 from .http3_frame_error import HTTP3FrameError
 from .decoding_error import DecodingError
@@ -8,3 +8,17 @@ class TransmissionError(Exception):
     """
     def __init__(self, message: str = "Transmission error"):
         super().__init__(message)
+
+
+class PartialTransmissionError(TransmissionError):
+    """
+    Exception raised when a batch transmission fails after sending some datagrams.
+
+    datagrams_sent and bytes_sent record the progress made before the failure, so
+    a caller can retry only the datagrams that were not sent.
+    """
+    def __init__(self, message: str = "Partial transmission error",
+                 datagrams_sent: int = 0, bytes_sent: int = 0):
+        super().__init__(message)
+        self.datagrams_sent = datagrams_sent
+        self.bytes_sent = bytes_sent
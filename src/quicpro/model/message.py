@@ -1,11 +1,20 @@
 """
 This module defines the Message model that encapsulates the content to be transmitted.
 """
-from pydantic import BaseModel
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Dict
 
-class Message(BaseModel):
+@dataclass
+class Message:
     """
     Message model that encapsulates the content to be transmitted.
+
+    A slotted dataclass rather than a pydantic model: it is built once per
+    outgoing message, and its single untyped field needs no validation.
     """
+    __slots__ = ("content",)
     content: Any
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the message fields as a dict, as pydantic's model_dump did."""
+        return {"content": self.content}
@@ -1,9 +1,10 @@
 """
 Module defining the TLS configuration model for QUIC encryption and decryption.
 This model uses Pydantic to ensure that the AES-GCM key is exactly 32 bytes and the IV
-is exactly 12 bytes.
+is exactly 12 bytes. The same key and IV sizes are used for ChaCha20-Poly1305.
 """
 
+from typing import Literal
 from pydantic import BaseModel, Field, field_validator
 
 class TLSConfig(BaseModel):
@@ -13,6 +14,11 @@ class TLSConfig(BaseModel):
     Attributes:
         key (bytes): 32-byte (256-bit) symmetric key.
         iv (bytes): 12-byte static IV for nonce derivation.
+        cipher (str): The demo-mode AEAD: "AES_256_GCM", "CHACHA20_POLY1305", or "auto"
+            to use ChaCha20-Poly1305 when the CPU has no AES instructions. Both
+            peers must end up with the same cipher.
+        backend (str): Where demo-mode AES-GCM runs: "cryptography" (default) or
+            "af_alg" for the Linux kernel crypto API, which suits large payloads.
     """
     key: bytes = Field(
         ...,
@@ -26,6 +32,14 @@ class TLSConfig(BaseModel):
         max_length=12,
         description="12-byte static IV for nonce derivation."
     )
+    cipher: Literal["AES_256_GCM", "CHACHA20_POLY1305", "auto"] = Field(
+        "AES_256_GCM",
+        description="AEAD used in demo mode; 'auto' picks ChaCha20-Poly1305 without AES hardware support."
+    )
+    backend: Literal["cryptography", "af_alg"] = Field(
+        "cryptography",
+        description="Demo-mode AEAD implementation; 'af_alg' offloads AES-GCM to the Linux kernel."
+    )
 
     @field_validator("key")
     @classmethod
@@ -1,13 +1,24 @@
 import logging
-from typing import Any
+import re
+from typing import Any, Iterable
 from quicpro.exceptions import DecodingError
 
 logger = logging.getLogger(__name__)
 
+_FRAME_PREFIX = b"Frame("
+_FRAME_CLOSE = b")"
+_FRAME_RE = re.compile(
+    re.escape(_FRAME_PREFIX) + rb"([^)]*)" + re.escape(_FRAME_CLOSE))
+# Packets may arrive as memoryviews, where `in` compares single ints rather than
+# searching for a subsequence; a regex search works on any buffer without copying.
+_FRAME_PREFIX_RE = re.compile(re.escape(_FRAME_PREFIX))
+
 
 class Decoder:
     """Decoder class to decode QUIC packets."""
 
+    __slots__ = ("consumer_app",)
+
     def __init__(self, consumer_app: Any) -> None:
         """Initialize the Decoder with a consumer application."""
         self.consumer_app = consumer_app
@@ -15,18 +26,13 @@ class Decoder:
     def decode(self, quic_packet: bytes) -> None:
         """Decode the given QUIC packet and pass the message to the consumer app."""
         try:
-            frame_prefix = b"Frame("
-            start_index = quic_packet.find(frame_prefix)
-            if start_index != -1:
-                start_index += len(frame_prefix)
-                end_index = quic_packet.find(b")", start_index)
-                if end_index != -1:
-                    message_content = quic_packet[start_index:end_index].decode(
-                        "utf-8")
-                else:
-                    logger.warning(
-                        "Closing delimiter not found; defaulting to 'Unknown'.")
-                    message_content = "Unknown"
+            match = _FRAME_RE.search(quic_packet)
+            if match is not None:
+                message_content = match.group(1).decode("utf-8")
+            elif _FRAME_PREFIX_RE.search(quic_packet) is not None:
+                logger.warning(
+                    "Closing delimiter not found; defaulting to 'Unknown'.")
+                message_content = "Unknown"
             else:
                 logger.warning(
                     "Frame prefix not found; defaulting to 'Unknown'.")
@@ -37,6 +43,34 @@ class Decoder:
             logger.exception("Decoder encountered an error: %s", exc)
             raise DecodingError(f"Error decoding quic packet: {exc}") from exc
 
+    def decode_batch(self, quic_packets: Iterable[bytes]) -> None:
+        """
+        Decode several QUIC packets in order and pass each message to the consumer app.
+
+        Processing stops at the first packet that fails, with the same
+        DecodingError that decode() raises.
+        """
+        consume = self.consumer_app.consume
+        search = _FRAME_RE.search
+        search_prefix = _FRAME_PREFIX_RE.search
+        try:
+            for quic_packet in quic_packets:
+                match = search(quic_packet)
+                if match is not None:
+                    message_content = match.group(1).decode("utf-8")
+                elif search_prefix(quic_packet) is not None:
+                    logger.warning(
+                        "Closing delimiter not found; defaulting to 'Unknown'.")
+                    message_content = "Unknown"
+                else:
+                    logger.warning(
+                        "Frame prefix not found; defaulting to 'Unknown'.")
+                    message_content = "Unknown"
+                consume(message_content)
+        except Exception as exc:
+            logger.exception("Decoder encountered an error: %s", exc)
+            raise DecodingError(f"Error decoding quic packet: {exc}") from exc
+
     def consume(self, message: str) -> None:
         """Consume the provided message using the consumer app."""
         self.consumer_app.consume(message)
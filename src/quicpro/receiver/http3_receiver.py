@@ -7,16 +7,27 @@ to a downstream decoder.
 For demo purposes, the header block is assumed to be prefixed with a 2-byte big-endian length.
 If a custom _decode_frame method is provided, its output is used; otherwise the entire
 extracted frame is passed to the downstream decoder.
+The extracted frame is a memoryview into the incoming packet, so no frame bytes
+are copied before the final text decode.
 """
+import codecs
 import logging
+from typing import Iterable, Union
 from quicpro.exceptions import HTTP3FrameError
 
 logger = logging.getLogger(__name__)
 
+# Called directly instead of str(..., "utf-8") to skip the codec lookup;
+# accepts both bytes and memoryview frames.
+_utf8_decode = codecs.utf_8_decode
+
 
 class HTTP3Receiver:
     """HTTP3Receiver processes incoming QUIC packets and decodes HTTP/3 frames."""
-    
+
+    # "_decode_frame" is an optional per-instance hook and stays unset by default.
+    __slots__ = ("decoder", "_decode_frame")
+
     def __init__(self, decoder: object) -> None:
         """
         Initialize the HTTP3Receiver.
@@ -25,7 +36,7 @@ class HTTP3Receiver:
         """
         self.decoder = decoder
 
-    def receive(self, quic_packet: bytes) -> None:
+    def receive(self, quic_packet: Union[bytes, memoryview]) -> None:
         """Receives a QUIC packet and processes it to extract and decode the HTTP/3 frame."""
         try:
             logger.debug(
@@ -35,12 +46,13 @@ class HTTP3Receiver:
                 raise HTTP3FrameError(
                     "Extracted HTTP/3 frame failed validation.")
             logger.info("HTTP3Receiver successfully decoded frame")
-            if hasattr(self, "_decode_frame"):
-                header_block, _ = self._decode_frame(frame)
+            decode_frame = getattr(self, "_decode_frame", None)
+            if decode_frame is not None:
+                header_block, _ = decode_frame(frame)
             else:
                 header_block = frame
             try:
-                message = header_block.decode("utf-8")
+                message = _utf8_decode(header_block, "strict", True)[0]
             except UnicodeDecodeError:
                 message = "Unknown"
             self.decoder.consume(message)
@@ -51,17 +63,65 @@ class HTTP3Receiver:
             logger.exception("Unexpected error during processing", exc_info=exc)
             raise
 
-    def _extract_http3_frame(self, packet: bytes) -> bytes:
-        """Extracts the HTTP/3 frame from the incoming packet."""
+    def receive_batch(self, quic_packets: Iterable[Union[bytes, memoryview]]) -> None:
+        """
+        Receives several QUIC packets and processes them in order, as receive() does.
+
+        Frame extraction and validation are inlined in a single loop so that
+        the per-packet method calls are paid once per batch. Processing stops
+        at the first packet that fails; earlier packets have been delivered.
+        """
+        consume = self.decoder.consume
+        decode_frame = getattr(self, "_decode_frame", None)
+        count = 0
+        try:
+            for packet in quic_packets:
+                if not packet:
+                    raise HTTP3FrameError("Empty packet received.")
+                frame = packet
+                if len(packet) >= 2:
+                    length = (packet[0] << 8) | packet[1]
+                    if len(packet) >= 2 + length:
+                        frame = memoryview(packet)[2:2 + length]
+                if not frame:
+                    raise HTTP3FrameError(
+                        "Extracted HTTP/3 frame failed validation.")
+                if decode_frame is not None:
+                    header_block, _ = decode_frame(frame)
+                else:
+                    header_block = frame
+                try:
+                    message = _utf8_decode(header_block, "strict", True)[0]
+                except UnicodeDecodeError:
+                    message = "Unknown"
+                consume(message)
+                count += 1
+        except HTTP3FrameError as exc:
+            logger.exception("HTTP3Receiver batch processing failed after %d packets",
+                             count, exc_info=exc)
+            raise
+        except Exception as exc:
+            logger.exception("Unexpected error during batch processing", exc_info=exc)
+            raise
+        logger.debug("HTTP3Receiver processed batch of %d packets", count)
+
+    def _extract_http3_frame(
+            self, packet: Union[bytes, memoryview]) -> Union[bytes, memoryview]:
+        """
+        Extracts the HTTP/3 frame from the incoming packet.
+
+        A length-prefixed frame is returned as a memoryview slice of the packet
+        instead of a copy; otherwise the packet itself is returned.
+        """
         if not packet:
             raise HTTP3FrameError("Empty packet received.")
         if len(packet) >= 2:
-            length = int.from_bytes(packet[:2], byteorder="big")
+            length = (packet[0] << 8) | packet[1]
             if len(packet) >= 2 + length:
-                return packet[2:2 + length]
+                return memoryview(packet)[2:2 + length]
         return packet
 
-    def _validate_frame(self, frame: bytes) -> bool:
+    def _validate_frame(self, frame: Union[bytes, memoryview]) -> bool:
         """Validates the extracted HTTP/3 frame."""
         return len(frame) > 0
 
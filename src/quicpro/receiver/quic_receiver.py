@@ -8,7 +8,7 @@ header decoding and stream demultiplexing.
 """
 
 import logging
-from typing import Any
+from typing import Any, Union
 
 from quicpro.exceptions.quic_frame_reassembly_error import QUICFrameReassemblyError
 from quicpro.utils.quic.packet.decoder import decode_quic_packet
@@ -32,16 +32,17 @@ class QUICReceiver:
         """
         self.http3_receiver = http3_receiver
 
-    def receive(self, quic_packet: bytes) -> None:
+    def receive(self, quic_packet: Union[bytes, memoryview]) -> None:
         """
         Decode an incoming QUIC packet and forward the extracted HTTP/3 frame.
 
         The packet is decoded using a standard format (header marker, length,
         checksum, and payload). If decoding fails or the frame is invalid,
-        a QUICFrameReassemblyError is raised.
+        a QUICFrameReassemblyError is raised. The frame is forwarded as a
+        memoryview into the packet, without copying.
 
         Args:
-            quic_packet (bytes): The raw QUIC packet to process.
+            quic_packet (Union[bytes, memoryview]): The raw QUIC packet to process.
 
         Raises:
             QUICFrameReassemblyError: If the packet cannot be reassembled.
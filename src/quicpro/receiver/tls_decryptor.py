@@ -2,39 +2,49 @@
 TLS Decryptor Module
 This module decrypts incoming AES-GCM encrypted UDP datagrams and passes the
 decrypted QUIC packet to a QUICReceiver. It supports two modes:
-  - Demo mode: Uses AES-GCM decryption with a nonce derived from a static IV and a demo
-    sequence number.
+  - Demo mode: Uses AES-GCM (or ChaCha20-Poly1305, per TLSConfig.cipher) decryption
+    with a nonce derived from a static IV and a demo sequence number.
   - Real mode: Uses a provided DTLS/TLS context to decrypt the packet, allowing for full
     TLS 1.1/1.2/1.3 support with user-defined certificates.
-A parameter 'demo' (True/False) selects between these modes.
+A parameter 'demo' (True/False) selects between these modes. In demo mode,
+'passthrough' skips AES-GCM and only strips the sequence number, for tests that
+need the framing but not the cryptography.
 """
 import logging
+import struct
 from typing import Any, Optional
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from quicpro.model.tls_config import TLSConfig
 from quicpro.exceptions.decryption_error import DecryptionError
-from quicpro.utils.tls.base_tls_handler import BaseTLSHandler
+from quicpro.utils.tls2.base_tls_handler import BaseTLSHandler
 
 logger = logging.getLogger(__name__)
 
+# Reads the 8-byte big-endian sequence number that prefixes each record.
+_unpack_u64_from = struct.Struct(">Q").unpack_from
+
 class TLSDecryptor(BaseTLSHandler):
-    def __init__(self, quic_receiver: Any, config: TLSConfig, demo: bool = True, dtls_context: Optional[Any] = None) -> None:
-        super().__init__(config, demo, dtls_context)
+    def __init__(self, quic_receiver: Any, config: TLSConfig, demo: bool = True, dtls_context: Optional[Any] = None,
+                 passthrough: bool = False) -> None:
+        super().__init__(config, demo, dtls_context, passthrough)
         self.quic_receiver = quic_receiver
+        self._iv_int = int.from_bytes(self.config.iv, byteorder="big")
 
     def _compute_nonce(self, seq_number: int) -> bytes:
-        seq_bytes = seq_number.to_bytes(12, byteorder="big")
-        return bytes(iv_byte ^ seq_byte for iv_byte, seq_byte in zip(self.config.iv, seq_bytes))
+        return (self._iv_int ^ seq_number).to_bytes(12, byteorder="big")
 
     def decrypt(self, encrypted_packet: bytes) -> None:
         if self.demo:
             try:
                 if len(encrypted_packet) < 9:
                     raise ValueError("Encrypted packet is too short.")
-                seq_number = int.from_bytes(encrypted_packet[:8], byteorder="big")
-                ciphertext = encrypted_packet[8:]
-                nonce = self._compute_nonce(seq_number)
-                quic_packet = self.aesgcm.decrypt(nonce, ciphertext, None)
+                seq_number, = _unpack_u64_from(encrypted_packet)
+                ciphertext = memoryview(encrypted_packet)[8:]
+                if self.passthrough:
+                    quic_packet = ciphertext
+                else:
+                    nonce = self._compute_nonce(seq_number)
+                    quic_packet = self.aead.decrypt(nonce, ciphertext, None)
                 logger.info("Decrypted packet with sequence number %d", seq_number)
                 self.quic_receiver.receive(quic_packet)
             except Exception as e:
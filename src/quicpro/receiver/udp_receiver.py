@@ -2,19 +2,55 @@
 UDPReceiver module.
 This module implements a UDPReceiver that listens on a specified bind_address,
 receives UDP packets using nonblocking I/O and processes them concurrently.
+Each readiness event drains up to a configurable number of queued datagrams,
+which are handed to the worker pool as a single batch; an optional batch_handler
+receives the whole batch in one call instead of one packet_handler call per
+datagram. On Linux, UDP generic
+receive offload (GRO) can be enabled so that one read returns several coalesced
+datagrams, which are split back into packets as memoryview slices.
 It supports automatic socket rebind on errors.
 """
 
 import socket
 import selectors
+import struct
+import sys
 import threading
 import logging
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Callable, Tuple, Optional, Any
+from typing import Callable, List, Tuple, Optional, Any, Union
 
 logger = logging.getLogger(__name__)
 
+# Linux UDP_GRO socket option (linux/udp.h); not exported by the socket module.
+UDP_GRO = getattr(socket, "UDP_GRO", 104)
+GRO_BUFFER_SIZE = 65535
+_GRO_CMSG_SIZE = socket.CMSG_SPACE(struct.calcsize("i"))
+
+
+def split_gro_segments(data: bytes,
+                       ancdata: List[Tuple[int, int, bytes]]) -> List[Union[bytes, memoryview]]:
+    """
+    Split a GRO-coalesced read back into the original datagrams.
+
+    Args:
+        data (bytes): The data returned by recvmsg.
+        ancdata (List[Tuple[int, int, bytes]]): The ancillary data returned by recvmsg.
+
+    Returns:
+        List[Union[bytes, memoryview]]: The datagrams; memoryview slices of data if the
+        kernel reported a segment size, otherwise data itself.
+    """
+    for level, kind, cdata in ancdata:
+        if level == socket.IPPROTO_UDP and kind == UDP_GRO:
+            segment_size = struct.unpack("i", cdata[:struct.calcsize("i")])[0]
+            if 0 < segment_size < len(data):
+                view = memoryview(data)
+                return [view[i:i + segment_size]
+                        for i in range(0, len(data), segment_size)]
+    return [data]
+
 
 class UDPReceiver:
     """
@@ -27,29 +63,41 @@ class UDPReceiver:
         *,
         tls_decryptor: Optional[Any] = None,
         packet_handler: Optional[Callable[[bytes, Tuple[str, int]], None]] = None,
+        batch_handler: Optional[Callable[
+            [List[Tuple[Union[bytes, memoryview], Tuple[str, int]]]], None]] = None,
         buffer_size: int = 4096,
+        recv_batch_size: int = 32,
         max_rebind_attempts: int = 3,
         rebind_backoff: float = 1.0,
         max_workers: int = 8,
+        gro: bool = False,
     ) -> None:
         self.bind_address = bind_address
         self.config = {
             "buffer_size": buffer_size,
+            "recv_batch_size": recv_batch_size,
             "max_rebind_attempts": max_rebind_attempts,
             "rebind_backoff": rebind_backoff,
+            "gro": gro,
         }
         self.selector = selectors.DefaultSelector()
-        self._state = {"socket": None, "running": False, "thread": None}
+        self._state = {"socket": None, "running": False, "thread": None, "gro": False}
         self._thread_state = {"executor": ThreadPoolExecutor(max_workers=max_workers),
                               "lock": threading.Lock()}
+        self._rx_view = memoryview(
+            bytearray(max(buffer_size, GRO_BUFFER_SIZE) if gro else buffer_size))
         self.tls_decryptor = tls_decryptor
-        if packet_handler is None and tls_decryptor is not None:
+        self.batch_handler = batch_handler
+        if batch_handler is not None:
+            self.packet_handler = packet_handler
+        elif packet_handler is None and tls_decryptor is not None:
             self.packet_handler = lambda data, addr: tls_decryptor.decrypt(data)
         elif packet_handler is not None:
             self.packet_handler = packet_handler
         else:
             raise ValueError(
-                "Either 'packet_handler' or 'tls_decryptor' must be provided.")
+                "One of 'packet_handler', 'batch_handler' or 'tls_decryptor' "
+                "must be provided.")
 
     def __enter__(self) -> "UDPReceiver":
         """Enter the runtime context, starting the receiver."""
@@ -71,9 +119,22 @@ class UDPReceiver:
             s.close()
             raise e
         self._state["socket"] = s
+        self._state["gro"] = self.config["gro"] and self._enable_gro(s)
         self.selector.register(s, selectors.EVENT_READ)
         logger.info("Socket bound to %s", self.bind_address)
 
+    @staticmethod
+    def _enable_gro(sock: socket.socket) -> bool:
+        """Enable UDP GRO on the socket; returns False where it is unsupported."""
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            sock.setsockopt(socket.IPPROTO_UDP, UDP_GRO, 1)
+        except OSError as e:
+            logger.debug("UDP GRO unavailable, reading datagrams singly: %s", e)
+            return False
+        return True
+
     def start(self) -> None:
         """Start the UDPReceiver."""
         with self._thread_state["lock"]:
@@ -88,20 +149,18 @@ class UDPReceiver:
             logger.info("UDPReceiver started.")
 
     def _event_loop(self) -> None:
+        # select() blocks until the socket is readable, so the loop wakes up
+        # only for incoming datagrams or once per second to check for stop().
         rebind_attempts = 0
         while self._state["running"]:
             try:
                 events = self.selector.select(timeout=1)
                 for _, mask in events:
                     if mask & selectors.EVENT_READ:
-                        try:
-                            assert self._state["socket"] is not None
-                            data, addr = self._state["socket"].recvfrom(
-                                self.config["buffer_size"])
-                        except BlockingIOError:
-                            continue
-                        self._thread_state["executor"].submit(
-                            self._handle_packet, data, addr)
+                        batch = self._drain_socket()
+                        if batch:
+                            self._thread_state["executor"].submit(
+                                self._handle_batch, batch)
             except (OSError, ValueError) as e:
                 logger.exception("Event loop encountered error: %s", e)
                 rebind_attempts += 1
@@ -119,10 +178,58 @@ class UDPReceiver:
                     except OSError as bind_error:
                         logger.exception(
                             "Failed to rebind socket: %s", bind_error)
-            time.sleep(0.01)
         logger.info("Event loop terminated.")
 
-    def _handle_packet(self, data: bytes, addr: Tuple[str, int]) -> None:
+    def _drain_socket(self) -> List[Tuple[Union[bytes, memoryview], Tuple[str, int]]]:
+        """
+        Read up to recv_batch_size queued datagrams from the nonblocking socket.
+
+        All reads go into one preallocated receive buffer, and each read is
+        copied out once at its exact size, since the batch is processed on a
+        worker thread while the buffer is reused. With GRO active, each read may
+        carry several coalesced datagrams, which are split into memoryview
+        slices of that copy.
+
+        Returns:
+            List[Tuple[Union[bytes, memoryview], Tuple[str, int]]]: The received
+            (data, addr) pairs, empty if no datagram was ready.
+        """
+        sock = self._state["socket"]
+        assert sock is not None
+        batch = []
+        if self._state["gro"]:
+            rx_view = self._rx_view[:GRO_BUFFER_SIZE]
+            recvmsg_into = sock.recvmsg_into
+            for _ in range(self.config["recv_batch_size"]):
+                try:
+                    nbytes, ancdata, _, addr = recvmsg_into([rx_view], _GRO_CMSG_SIZE)
+                except BlockingIOError:
+                    break
+                batch.extend((segment, addr) for segment in
+                             split_gro_segments(bytes(rx_view[:nbytes]), ancdata))
+            return batch
+        rx_view = self._rx_view[:self.config["buffer_size"]]
+        recvfrom_into = sock.recvfrom_into
+        for _ in range(self.config["recv_batch_size"]):
+            try:
+                nbytes, addr = recvfrom_into(rx_view)
+            except BlockingIOError:
+                break
+            batch.append((bytes(rx_view[:nbytes]), addr))
+        return batch
+
+    def _handle_batch(
+            self, batch: List[Tuple[Union[bytes, memoryview], Tuple[str, int]]]) -> None:
+        if self.batch_handler is not None:
+            try:
+                self.batch_handler(batch)
+            except Exception as e:
+                logger.exception("Batch handler error for %d packets: %s", len(batch), e)
+            return
+        for data, addr in batch:
+            self._handle_packet(data, addr)
+
+    def _handle_packet(self, data: Union[bytes, memoryview], addr: Tuple[str, int]) -> None:
         try:
             self.packet_handler(data, addr)
         except Exception as e:
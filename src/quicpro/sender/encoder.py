@@ -33,9 +33,13 @@ class Encoder:
             else:
                 raise EncodingError("Unsupported message type")
             frame = b"Frame(" + content.encode("utf-8") + b")"
-            logger.info("Encoder produced frame: %s", frame)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Encoder produced frame: %s", frame)
             self.http3_sender.send(frame)
+        except EncodingError:
+            raise
         except Exception as e:
+            # The single place the send path logs a traceback; lower layers only wrap.
             logger.exception("Encoding failed: %s", e)
             raise EncodingError(f"Encoding failed: {e}") from e
 
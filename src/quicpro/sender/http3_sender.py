@@ -4,13 +4,17 @@ This module implements the HTTP3Sender class, which maps a QPACK-encoded HTTP/3
 stream frame onto a QUIC packet and sends it via the underlying QUIC sender.
 The frame is produced in the form:
     HTTP3Stream(stream_id=<id>, payload=Frame(<content>))
-which meets test expectations.
+which meets test expectations. The prefix up to "Frame(" only depends on the
+stream id, so it is built when the stream id is set rather than on every send.
 """
 import logging
+from typing import Union
 from quicpro.exceptions import TransmissionError
 
 logger = logging.getLogger(__name__)
 
+_FRAME_SUFFIX = b"))"
+
 
 class HTTP3Sender:
     """
@@ -34,13 +38,26 @@ class HTTP3Sender:
         self.stream_id = stream_id
         self.priority = None
 
-    def send(self, frame: bytes) -> None:
-        """Send the HTTP/3 stream frame."""
+    @property
+    def stream_id(self) -> int:
+        """The stream identifier."""
+        return self._stream_id
+
+    @stream_id.setter
+    def stream_id(self, stream_id: int) -> None:
+        self._stream_id = stream_id
+        self._frame_prefix = b"HTTP3Stream(stream_id=%d, payload=Frame(" % stream_id
+
+    def send(self, frame: Union[bytes, bytearray, memoryview]) -> None:
+        """Send the HTTP/3 stream frame; any bytes-like frame is accepted."""
         try:
-            stream_frame = (b"HTTP3Stream(stream_id=%d, payload=Frame(" % self.stream_id + frame + b"))")
-            logger.info("HTTP3Sender created stream frame for stream %d", self.stream_id)
+            # join() sizes the result once and copies frame a single time.
+            stream_frame = b"".join((self._frame_prefix, frame, _FRAME_SUFFIX))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("HTTP3Sender created stream frame for stream %d", self.stream_id)
             self.quic_sender.send(stream_frame)
+        except TransmissionError:
+            raise
         except Exception as exc:
-            logger.exception("HTTP3Sender mapping failed: %s", exc)
             raise TransmissionError(f"HTTP3Sender failed: {exc}") from exc
 
@@ -1,10 +1,16 @@
 """
 Network module.
 Handles low-level UDP socket operations.
+A datagram can also be sent from several buffers at once with transmit_parts(),
+which lets the kernel gather them instead of joining them in Python first.
+transmit_many() sends a batch of datagrams in one call, with the socket lookup
+and logging done once per batch rather than once per datagram. If it fails
+part-way, it raises PartialTransmissionError recording how far it got.
 """
 import socket
 import logging
-from typing import Tuple
+from typing import Iterable, Sequence, Tuple
+from quicpro.exceptions import PartialTransmissionError
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +50,48 @@ class Network:
             logger.exception("Network transmission failed: %s", exc)
             raise
 
+    def transmit_parts(self, parts: Sequence[bytes]) -> int:
+        """
+        Send the concatenation of parts as one UDP datagram.
+        Uses sendmsg() where available, so the buffers are not copied into one first.
+        """
+        try:
+            if hasattr(self.socket, "sendmsg"):
+                bytes_sent = self.socket.sendmsg(parts, (), 0, self.remote_address)
+            else:
+                bytes_sent = self.socket.sendto(b"".join(parts), self.remote_address)
+            logger.info("Transmitted %d bytes to %s",
+                        bytes_sent, self.remote_address)
+            return bytes_sent
+        except Exception as exc:
+            logger.exception("Network transmission failed: %s", exc)
+            raise
+
+    def transmit_many(self, datagrams: Iterable[bytes]) -> int:
+        """
+        Send each of datagrams as its own UDP datagram and return the total bytes sent.
+        Python exposes no sendmmsg(), so this is one sendto() per datagram.
+        Raises:
+          PartialTransmissionError: if a send fails; it records the datagrams and
+          bytes sent before the failure.
+        """
+        count = 0
+        bytes_sent = 0
+        try:
+            sendto = self.socket.sendto
+            remote_address = self.remote_address
+            for datagram in datagrams:
+                bytes_sent += sendto(datagram, remote_address)
+                count += 1
+            logger.info("Transmitted %d datagrams (%d bytes) to %s",
+                        count, bytes_sent, remote_address)
+            return bytes_sent
+        except Exception as exc:
+            logger.exception("Network transmission failed after %d datagrams: %s", count, exc)
+            raise PartialTransmissionError(
+                f"Batch transmission failed after {count} datagrams: {exc}",
+                datagrams_sent=count, bytes_sent=bytes_sent) from exc
+
     def close(self) -> None:
         """Close the UDP socket."""
         try:
@@ -26,15 +26,21 @@ class QUICSender:
         """
         try:
             quic_packet = encode_quic_packet(stream_frame)
-            logger.info("QUICSender packaged packet: %s", quic_packet)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("QUICSender packaged packet: %s", quic_packet)
             self.tls_encryptor.encrypt(quic_packet)
+        except TransmissionError:
+            raise
         except Exception as e:
-            logger.exception("QUICSender packaging failed: %s", e)
             raise TransmissionError(f"Transmission error: {e}") from e
 
     def close(self) -> None:
         """
         Close the sender and perform any necessary cleanup.
+        Records still buffered by the TLS encryptor are flushed first.
         """
         logger.info("QUICSender is closing.")
+        close = getattr(self.tls_encryptor, "close", None)
+        if close is not None:
+            close()
 
@@ -1,49 +1,170 @@
 """
 TLS Encryptor Module
 This module encrypts QUIC packets using one of two modes:
-  - Demo mode: A simplified TLS-like encryption using AES-GCM.
+  - Demo mode: A simplified TLS-like encryption using AES-GCM, or ChaCha20-Poly1305
+    as selected by TLSConfig.cipher.
   - Real mode: A production-ready TLS encryption branch which leverages a DTLS/TLS library.
 A parameter 'demo' (True/False) selects between these modes. In real mode, a DTLS
-context must be provided.
+context must be provided. In demo mode, 'passthrough' skips AES-GCM and only adds
+the sequence number, for tests that need the framing but not the cryptography.
+encrypt_many() encrypts a batch of packets in one loop with the AES-GCM context
+and sender hoisted out of it; encrypt_bulk() splits one large payload into
+packet-sized chunks and sends them as a single batch.
+With flush_every=N, demo records are buffered and handed to the UDP sender's
+send_many() N at a time; encrypt(..., flush=True) sends at once, for packets
+that must not wait (e.g. ACK-eliciting ones), and flush() drains the buffer.
+close(), also called on leaving a with block, flushes whatever is still buffered.
+Failures are raised as EncryptionError without logging here; the traceback is
+logged once by the caller at the API boundary rather than on every packet.
 """
 import logging
-from typing import Any, Optional
+import struct
+from typing import Any, Iterable, List, Optional
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from quicpro.model.tls_config import TLSConfig
 from quicpro.exceptions.encryption_error import EncryptionError
-from quicpro.utils.tls.base_tls_handler import BaseTLSHandler
+from quicpro.utils.tls2.base_tls_handler import BaseTLSHandler
 
 logger = logging.getLogger(__name__)
 
+# Packs the 8-byte big-endian sequence number that prefixes each record.
+_pack_u64 = struct.Struct(">Q").pack
+
 class TLSEncryptor(BaseTLSHandler):
-    def __init__(self, udp_sender: Any, config: TLSConfig, demo: bool = True, dtls_context: Optional[Any] = None) -> None:
-        super().__init__(config, demo, dtls_context)
+    def __init__(self, udp_sender: Any, config: TLSConfig, demo: bool = True, dtls_context: Optional[Any] = None,
+                 passthrough: bool = False, flush_every: int = 1) -> None:
+        super().__init__(config, demo, dtls_context, passthrough)
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1.")
         self.udp_sender = udp_sender
+        self.flush_every = flush_every
+        self._send_many = getattr(udp_sender, "send_many", None)
+        self._pending: List[bytes] = []
+        # Senders with send_parts() get the sequence prefix and ciphertext as separate
+        # buffers, so the record is never joined in Python.
+        self._send_parts = getattr(udp_sender, "send_parts", None)
         if self.demo:
             self._sequence_number = 0
+            self._iv_int = int.from_bytes(self.config.iv, byteorder="big")
+
+    def _compute_nonce(self, sequence_number: Optional[int] = None) -> bytes:
+        if sequence_number is None:
+            sequence_number = self._sequence_number
+        return (self._iv_int ^ sequence_number).to_bytes(12, byteorder="big")
 
-    def _compute_nonce(self) -> bytes:
-        seq_bytes = self._sequence_number.to_bytes(12, byteorder="big")
-        return bytes(iv_byte ^ seq_byte for iv_byte, seq_byte in zip(self.config.iv, seq_bytes))
+    def _compute_nonces(self, start_sequence_number: int, count: int) -> List[bytes]:
+        iv_int = self._iv_int
+        return [(iv_int ^ sequence_number).to_bytes(12, byteorder="big")
+                for sequence_number in range(start_sequence_number, start_sequence_number + count)]
 
-    def encrypt(self, quic_packet: bytes) -> None:
+    def _flush_pending(self) -> None:
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if self._send_many is not None:
+            self._send_many(pending)
+        else:
+            for record in pending:
+                self.udp_sender.send(record)
+
+    def flush(self) -> None:
+        """Send any records buffered by flush_every."""
+        try:
+            self._flush_pending()
+        except Exception as e:
+            raise EncryptionError(f"Flushing buffered records failed: {e}") from e
+
+    def encrypt(self, quic_packet: bytes, flush: bool = False) -> None:
         if self.demo:
             try:
-                nonce = self._compute_nonce()
-                ciphertext = self.aesgcm.encrypt(nonce, quic_packet, None)
-                record = self._sequence_number.to_bytes(8, byteorder="big") + ciphertext
-                logger.info("TLSEncryptor (demo) produced packet with sequence number %d", self._sequence_number)
-                self.udp_sender.send(record)
+                if self.passthrough:
+                    ciphertext = quic_packet
+                else:
+                    nonce = self._compute_nonce()
+                    ciphertext = self.aead.encrypt(nonce, quic_packet, None)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("TLSEncryptor (demo) produced packet with sequence number %d",
+                                 self._sequence_number)
+                if self.flush_every > 1:
+                    self._pending.append(_pack_u64(self._sequence_number) + ciphertext)
+                    if flush or len(self._pending) >= self.flush_every:
+                        self._flush_pending()
+                elif self._send_parts is not None:
+                    self._send_parts((_pack_u64(self._sequence_number), ciphertext))
+                else:
+                    self.udp_sender.send(_pack_u64(self._sequence_number) + ciphertext)
             except Exception as e:
-                logger.exception("TLSEncryptor demo encryption failed: %s", e)
                 raise EncryptionError(f"Demo encryption failed: {e}") from e
             finally:
                 self._sequence_number += 1
         else:
             try:
                 encrypted_packet = self.dtls_context.encrypt(quic_packet)
-                logger.info("TLSEncryptor (real) encrypted packet using DTLS context.")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("TLSEncryptor (real) encrypted packet using DTLS context.")
                 self.udp_sender.send(encrypted_packet)
             except Exception as e:
-                logger.exception("TLSEncryptor real encryption failed: %s", e)
                 raise EncryptionError(f"Real encryption failed: {e}") from e
+
+    def encrypt_many(self, quic_packets: Iterable[bytes]) -> None:
+        """
+        Encrypt and send several packets in order, as repeated encrypt() calls would.
+        With a send_many() sender or flush_every > 1, the batch and any buffered
+        records go out together in one send_many() call at the end.
+        """
+        if not self.demo:
+            for quic_packet in quic_packets:
+                self.encrypt(quic_packet)
+            return
+        quic_packets = list(quic_packets)
+        send = self.udp_sender.send
+        send_parts = self._send_parts
+        # Records are collected locally and only queued once the whole batch has been
+        # built, so a failure part-way leaves no stray records behind in _pending.
+        batch: Optional[List[bytes]] = (
+            [] if self._send_many is not None or self.flush_every > 1 else None)
+        first_sequence_number = self._sequence_number
+        if self.passthrough:
+            encrypt, nonces = None, None
+        else:
+            encrypt = self.aead.encrypt
+            nonces = self._compute_nonces(first_sequence_number, len(quic_packets))
+        try:
+            for index, quic_packet in enumerate(quic_packets):
+                sequence_number = first_sequence_number + index
+                self._sequence_number = sequence_number + 1
+                if encrypt is None:
+                    ciphertext = quic_packet
+                else:
+                    ciphertext = encrypt(nonces[index], quic_packet, None)
+                if batch is not None:
+                    batch.append(_pack_u64(sequence_number) + ciphertext)
+                elif send_parts is not None:
+                    send_parts((_pack_u64(sequence_number), ciphertext))
+                else:
+                    send(_pack_u64(sequence_number) + ciphertext)
+            if batch is not None:
+                self._pending.extend(batch)
+                self._flush_pending()
+        except Exception as e:
+            raise EncryptionError(f"Demo encryption failed: {e}") from e
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("TLSEncryptor (demo) produced packets with sequence numbers %d-%d",
+                         first_sequence_number, self._sequence_number - 1)
+
+    def encrypt_bulk(self, payload: bytes, packet_size: int = 1200) -> None:
+        """Split payload into packet_size chunks and encrypt and send them as one batch."""
+        if packet_size <= 0:
+            raise ValueError("packet_size must be positive.")
+        view = memoryview(payload)
+        self.encrypt_many([view[i:i + packet_size] for i in range(0, len(view), packet_size)])
+
+    def close(self) -> None:
+        """Send any records still buffered by flush_every."""
+        self.flush()
+
+    def __enter__(self) -> "TLSEncryptor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
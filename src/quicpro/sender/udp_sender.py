@@ -1,11 +1,15 @@
 """
 UDPSender module.
 Transmits encrypted packets over UDP with retry logic and context management.
+send_parts() sends a packet given as several buffers, gathered by the network
+layer when it supports transmit_parts(). send_many() sends a batch of packets
+through transmit_many() when the network layer provides it; after a partial
+failure only the datagrams that were not sent are retried.
 """
 import logging
 import time
-from typing import Any
-from quicpro.exceptions import TransmissionError
+from typing import Any, Callable, Sequence
+from quicpro.exceptions import PartialTransmissionError, TransmissionError
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +30,59 @@ class UDPSender:
         Raises:
           TransmissionError: if all retries fail.
         """
+        return self._send_with_retry(self.network.transmit, encrypted_packet)
+
+    def send_parts(self, parts: Sequence[bytes]) -> int:
+        """
+        Send an encrypted packet given as a sequence of buffers, with retry logic.
+        Networks without transmit_parts() receive the joined packet instead.
+        Raises:
+          TransmissionError: if all retries fail.
+        """
+        transmit_parts = getattr(self.network, "transmit_parts", None)
+        if transmit_parts is None:
+            return self._send_with_retry(self.network.transmit, b"".join(parts))
+        return self._send_with_retry(transmit_parts, parts)
+
+    def send_many(self, encrypted_packets: Sequence[bytes]) -> int:
+        """
+        Send a batch of encrypted packets and return the total bytes sent.
+        If transmit_many() fails part-way with PartialTransmissionError, the retry
+        resumes after the last datagram sent, so no packet is sent twice. Networks
+        without transmit_many() get one send() per packet.
+        Raises:
+          TransmissionError: if all retries fail.
+        """
+        transmit_many = getattr(self.network, "transmit_many", None)
+        if transmit_many is None:
+            return sum(self._send_with_retry(self.network.transmit, packet)
+                       for packet in encrypted_packets)
+        remaining = list(encrypted_packets)
+        total_sent = 0
+        attempt = 0
+        while True:
+            try:
+                bytes_sent = transmit_many(remaining)
+                logger.info("Sent %d bytes on attempt %d", bytes_sent, attempt + 1)
+                return total_sent + bytes_sent
+            except Exception as e:
+                if isinstance(e, PartialTransmissionError):
+                    total_sent += e.bytes_sent
+                    remaining = remaining[e.datagrams_sent:]
+                attempt += 1
+                logger.exception(
+                    "UDPSender failed on attempt %d: %s", attempt, e)
+                if attempt > self.max_retries:
+                    raise TransmissionError(
+                        f"Failed after {self.max_retries} attempts: {e}"
+                    ) from e
+                time.sleep(self.retry_delay * attempt)
+
+    def _send_with_retry(self, transmit: Callable[[Any], int], payload: Any) -> int:
         attempt = 0
         while attempt <= self.max_retries:
             try:
-                bytes_sent = self.network.transmit(encrypted_packet)
+                bytes_sent = transmit(payload)
                 logger.info("Sent %d bytes on attempt %d",
                             bytes_sent, attempt + 1)
                 return bytes_sent
@@ -42,7 +95,7 @@ class UDPSender:
                         f"Failed after {self.max_retries} attempts: {e}"
                     ) from e
                 time.sleep(self.retry_delay * attempt)
-        raise RuntimeError("Unexpected end of UDPSender.send()")
+        raise RuntimeError("Unexpected end of UDPSender._send_with_retry()")
 
     def __enter__(self) -> "UDPSender":
         return self
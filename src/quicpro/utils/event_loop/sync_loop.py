@@ -1,10 +1,11 @@
 """
 sync_loop.py - Synchronous event loop implementation.
 This module implements a synchronous event loop using a ThreadPoolExecutor to schedule
-tasks concurrently.
+tasks concurrently. Pending futures are tracked in a set and dropped by a done
+callback, and run_forever() blocks on an event until stop() is called instead of
+polling.
 """
 import threading
-import time
 from concurrent.futures import ThreadPoolExecutor
 from .base_loop import BaseEventLoop
 
@@ -18,24 +19,32 @@ class SyncEventLoop(BaseEventLoop):
         self.executor = ThreadPoolExecutor(max_workers=max_workers)
         self.running = False
         self._lock = threading.Lock()
-        self._tasks = []
+        self._tasks = set()
+        self._stopped = threading.Event()
 
     def schedule_task(self, func, *args, **kwargs):
         future = self.executor.submit(func, *args, **kwargs)
         with self._lock:
-            self._tasks.append(future)
+            self._tasks.add(future)
+        # Registered outside the lock: the callback runs immediately if the
+        # task has already finished.
+        future.add_done_callback(self._on_done)
         return future
 
+    def _on_done(self, future) -> None:
+        with self._lock:
+            self._tasks.discard(future)
+
     def run_forever(self) -> None:
         self.running = True
+        self._stopped.clear()
         try:
             while self.running:
-                with self._lock:
-                    self._tasks = [t for t in self._tasks if not t.done()]
-                time.sleep(0.01)
+                self._stopped.wait()
         finally:
             self.stop()
 
     def stop(self) -> None:
         self.running = False
+        self._stopped.set()
         self.executor.shutdown(wait=True)
@@ -17,11 +17,14 @@ This implementation is written with complete type annotations and detailed loggi
 full observability, debugging, and maintainability in a production environment.
 """
 
+import functools
 import logging
-from typing import Any, Dict, Optional
+import struct
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional
 
-from quicpro.utils/quic.packet.encoder import encode_quic_packet
-from quicpro.utils/http3/qpack.encoder import QPACKEncoder
+from quicpro.utils.quic.packet.encoder import encode_quic_packet
+from quicpro.utils.http3.qpack.encoder import QPACKEncoder
 
 # Import production-grade frame handlers.
 from quicpro.utils.http3.frames.cancel_frame import handle_cancel_frame
@@ -40,6 +43,54 @@ from quicpro.utils.http3.frames.unknown_frame import handle_unknown_frame
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Headers sent with every request that passes none. They never change, so their block is
+# encoded once without the dynamic table (static references and never-indexed literals)
+# and reused; it must not add entries to the peer's table that the connection's encoder
+# would not know about.
+_REQUEST_HEADERS: Dict[str, str] = {
+    ":method": "GET",
+    ":path": "/index.html",
+    ":scheme": "https",
+    ":authority": "example.com"
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _encode_request_headers() -> bytes:
+    """Return the QPACK header block for _REQUEST_HEADERS."""
+    return QPACKEncoder(auditing=True).encode(_REQUEST_HEADERS, indexing=False)
+
+
+# Routed responses kept for receive_response(); the oldest is dropped once this many are unread.
+MAX_PENDING_RESPONSES = 64
+
+# 1-byte frame type and 2-byte payload length, and the 4-byte stream id that follows them.
+_FRAME_HEADER = struct.Struct("!BH")
+_STREAM_ID = struct.Struct("!I")
+
+# Frame handlers indexed by the 1-byte frame type, built once at import. Types without a
+# dedicated handler map to handle_unknown_frame, so dispatch is a single list index.
+_DISPATCH = [handle_unknown_frame] * 256
+_DISPATCH[0x07] = handle_cancel_frame
+_DISPATCH[0x08] = handle_close_frame
+_DISPATCH[0x09] = handle_control_frame
+_DISPATCH[0x0A] = handle_data_frame
+_DISPATCH[0x0B] = handle_error_frame
+_DISPATCH[0x0C] = handle_goaway_frame
+_DISPATCH[0x0D] = handle_ping_frame
+_DISPATCH[0x0E] = handle_priority_frame
+_DISPATCH[0x0F] = handle_priority_update_frame
+_DISPATCH[0x10] = handle_reset_frame
+_DISPATCH[0x11] = handle_settings_frame
+
+# Whether a frame type's payload starts with a 4-byte stream id whose remainder is forwarded
+# to that stream. Connection-level frames are fully consumed by their handler; unknown types
+# keep the generic stream-id-prefixed layout.
+_CARRIES_STREAM_ID = [True] * 256
+for _frame_type in (0x08, 0x09, 0x0B, 0x0C, 0x0D, 0x11):  # CLOSE, CONTROL, ERROR, GOAWAY, PING, SETTINGS
+    _CARRIES_STREAM_ID[_frame_type] = False
+del _frame_type
+
 
 class HTTP3ConnectionError(Exception):
     """Exception raised when a protocol violation or unrecoverable error occurs in HTTP3Connection."""
@@ -68,7 +119,13 @@ class HTTP3Connection:
         self.quic_manager = quic_manager
         self.stream_manager = quic_manager.stream_manager
         self.settings: Dict[str, Any] = {}
-        self._response: Optional[bytes] = None
+        self._responses: Deque[bytes] = deque(maxlen=MAX_PENDING_RESPONSES)
+        # Most recently routed stream; consecutive frames usually target the same one.
+        self._last_stream_id = -1
+        self._last_stream: Any = None
+        # One encoder per connection, so its dynamic table persists across requests
+        # that pass their own headers.
+        self._qpack = QPACKEncoder(auditing=True)
         logger.info("HTTP3Connection initialized with QUIC manager %r", quic_manager)
 
     def negotiate_settings(self, settings: Dict[str, Any]) -> None:
@@ -84,11 +141,12 @@ class HTTP3Connection:
         self.settings = settings
         logger.info("Negotiated HTTP/3 settings: %s", settings)
 
-    def send_request(self, request_body: bytes, *, priority: Optional[Any] = None, stream_id: Optional[int] = None) -> None:
+    def send_request(self, request_body: bytes, *, priority: Optional[Any] = None, stream_id: Optional[int] = None,
+                     headers: Optional[Dict[str, str]] = None) -> None:
         """
         Construct and send an HTTP/3 request.
 
-        This method constructs a QPACK header block (using a production-grade QPACKEncoder),
+        This method constructs a QPACK header block (using the connection's QPACKEncoder),
         concatenates it with the request body, then packages the complete frame into a QUIC packet
         using the QUIC packet encoder. Finally, the packet is sent via quic_manager.send_packet().
 
@@ -96,6 +154,8 @@ class HTTP3Connection:
             request_body: The HTTP request payload.
             priority: Optional parameter for setting stream priority.
             stream_id: Optional explicit stream identifier. If not provided, a new stream is created.
+            headers: Optional request headers. If not provided, the default GET headers are sent,
+                     whose encoded block is computed once and reused.
         Raises:
             Exception: Propagates any error encountered during header encoding or packet packaging.
         """
@@ -107,14 +167,10 @@ class HTTP3Connection:
             logger.debug("Created new stream with stream_id: %d", stream.stream_id)
 
         try:
-            qpack_encoder = QPACKEncoder(auditing=True)
-            headers = {
-                ":method": "GET",
-                ":path": "/index.html",
-                ":scheme": "https",
-                ":authority": "example.com"
-            }
-            encoded_headers = qpack_encoder.encode(headers)
+            if headers is None:
+                encoded_headers = _encode_request_headers()
+            else:
+                encoded_headers = self._qpack.encode(headers)
         except Exception as e:
             logger.exception("QPACK encoding failed: %s", e)
             raise
@@ -126,9 +182,37 @@ class HTTP3Connection:
             logger.exception("QUIC packet encoding failed: %s", e)
             raise
 
-        logger.info("Sending HTTP/3 request on stream %d, packet=%s", stream.stream_id, packet.hex())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending HTTP/3 request on stream %d, %d bytes", stream.stream_id, len(packet))
         self.quic_manager.send_packet(packet)
 
+    def send_request_batch(self, request_bodies: Iterable[bytes], *, priority: Optional[Any] = None) -> None:
+        """
+        Construct and send several HTTP/3 requests, each on a new stream, with the default headers.
+
+        All packets are encoded first and then handed to quic_manager.send_packets() in one
+        call, when the QUIC manager provides it; otherwise each is sent with send_packet().
+
+        Args:
+            request_bodies: The HTTP request payloads, one per request.
+            priority: Optional parameter for setting stream priority on every new stream.
+        Raises:
+            Exception: Propagates any error encountered during header encoding or packet packaging.
+        """
+        encoded_headers = _encode_request_headers()
+        packets: List[bytes] = []
+        for request_body in request_bodies:
+            self.stream_manager.create_stream(priority=priority)
+            packets.append(encode_quic_packet(encoded_headers + request_body))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending batch of %d HTTP/3 requests", len(packets))
+        send_packets = getattr(self.quic_manager, "send_packets", None)
+        if send_packets is not None:
+            send_packets(packets)
+        else:
+            for packet in packets:
+                self.quic_manager.send_packet(packet)
+
     def route_incoming_frame(self, packet: bytes) -> None:
         """
         Parse and dispatch an incoming QUIC packet containing an HTTP/3 frame.
@@ -138,8 +222,10 @@ class HTTP3Connection:
           - 2 bytes: Payload length (big-endian).
           - Payload: As defined by the specific frame type.
 
-        The payload is dispatched to the corresponding frame handler. Additionally, if the payload includes a
-        4-byte stream identifier at its beginning, that data is forwarded to the proper stream entity.
+        The payload is dispatched to the corresponding frame handler. For stream frames (every type except
+        CLOSE, CONTROL, ERROR, GOAWAY, PING and SETTINGS), the payload begins with a 4-byte stream identifier
+        and the data after it is forwarded to the proper stream entity.
+        Handlers and streams receive memoryview slices of the packet; only the stored response is copied.
 
         Args:
             packet: The received QUIC packet.
@@ -151,65 +237,65 @@ class HTTP3Connection:
             logger.error(msg)
             raise HTTP3ConnectionError(msg)
 
-        frame_type = packet[0]
-        payload_length = int.from_bytes(packet[1:3], byteorder="big")
+        frame_type, payload_length = _FRAME_HEADER.unpack_from(packet, 0)
         if len(packet) < 3 + payload_length:
             msg = f"Incomplete frame: expected payload of length {payload_length}, got {len(packet) - 3}."
             logger.error(msg)
             raise HTTP3ConnectionError(msg)
 
-        payload = packet[3:3+payload_length]
-        logger.debug("Parsed frame: type=0x{0:02x}, payload_length={1}".format(frame_type, payload_length))
+        # Handlers and streams get zero-copy views into the packet.
+        payload = memoryview(packet)[3:3+payload_length]
+        logger.debug("Parsed frame: type=0x%02x, payload_length=%d", frame_type, payload_length)
 
         # Dispatch frame using production-grade frame handlers.
-        dispatch_map = {
-            0x07: handle_cancel_frame,
-            0x08: handle_close_frame,
-            0x09: handle_control_frame,
-            0x0A: handle_data_frame,
-            0x0B: handle_error_frame,
-            0x0C: handle_goaway_frame,
-            0x0D: handle_ping_frame,
-            0x0E: handle_priority_frame,
-            0x0F: handle_priority_update_frame,
-            0x10: handle_reset_frame,
-            0x11: handle_settings_frame,
-        }
-
-        handler = dispatch_map.get(frame_type, handle_unknown_frame)
+        handler = _DISPATCH[frame_type]
         try:
             handler_result = handler(payload)
-            logger.debug("Frame handler for type 0x{0:02x} returned: {1}".format(frame_type, handler_result))
+            logger.debug("Frame handler for type 0x%02x returned: %s", frame_type, handler_result)
         except Exception as e:
             msg = f"Error processing frame type 0x{frame_type:02x}: {e}"
             logger.exception(msg)
             raise HTTP3ConnectionError(msg) from e
 
-        # Assume that the payload embeds a 4-byte stream identifier at its start,
+        if not _CARRIES_STREAM_ID[frame_type]:
+            self._responses.append(bytes(payload))
+            return
+
+        # Stream frames embed a 4-byte stream identifier at the start of the payload,
         # followed by stream-specific data.
         if len(payload) >= 4:
-            stream_id = int.from_bytes(payload[:4], byteorder="big")
-            stream = self.stream_manager.get_stream(stream_id)
-            if stream is None:
-                logger.warning("Stream with ID %d not found. Creating a new stream.", stream_id)
-                stream = self.stream_manager.create_stream(stream_id)
+            (stream_id,) = _STREAM_ID.unpack_from(packet, 3)
+            stream = self._last_stream
+            # A closed stream may have been dropped from the stream manager (the HTTP/3
+            # StreamManager pops streams on close), so it is looked up again.
+            if stream_id != self._last_stream_id or stream.state == "closed":
+                stream = self.stream_manager.get_stream(stream_id)
+                if stream is None:
+                    logger.warning("Stream with ID %d not found. Creating a new stream.", stream_id)
+                    stream = self.stream_manager.create_stream(stream_id)
+                self._last_stream_id = stream_id
+                self._last_stream = stream
             # Forward the remaining payload (after the stream_id) to the stream.
             stream_payload = payload[4:]
             stream.send_data(stream_payload)
             logger.info("Dispatched payload to stream %d; %d bytes delivered.", stream_id, len(stream_payload))
-            self._response = stream_payload
+            self._responses.append(bytes(stream_payload))
         else:
             logger.error("Payload missing stream identifier. Full payload set as response.")
-            self._response = payload
+            self._responses.append(bytes(payload))
 
     def receive_response(self, *args, **kwargs) -> Optional[bytes]:
         """
-        Return the response payload from the last successfully routed frame.
+        Return the oldest unread response payload from the successfully routed frames.
+
+        Responses are queued in routing order, up to MAX_PENDING_RESPONSES; each is returned once.
+        They are copied out of the packet, so the received packet buffer is not kept alive.
 
         Returns:
-            The response payload as bytes, or None if no valid response has been received.
+            The response payload as bytes, or None if no unread response is queued.
         """
-        return self._response
+        responses = self._responses
+        return responses.popleft() if responses else None
 
     def close(self) -> None:
         """
@@ -223,4 +309,6 @@ class HTTP3Connection:
             conn.close()
             logger.debug("Underlying QUIC connection closed.")
         self.stream_manager.close_all()
+        self._last_stream_id = -1
+        self._last_stream = None
         logger.info("HTTP/3 connection closed gracefully.")
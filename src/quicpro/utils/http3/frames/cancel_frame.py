@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 # Define the CANCEL frame type constant (example value; must conform to production spec)
 FRAME_TYPE_CANCEL = 0x07  # Production-defined CANCEL frame type
 
+# The whole frame: type, payload length, and the 4-byte stream_id payload.
+_CANCEL_FRAME = struct.Struct("!BHI")
+
 def handle_cancel_frame(stream_id: int) -> bytes:
     """
     Construct and return a CANCEL frame for the specified stream ID.
@@ -37,13 +40,9 @@ def handle_cancel_frame(stream_id: int) -> bytes:
         logger.error("Invalid stream_id provided for CANCEL frame: %s", stream_id)
         raise ValueError("stream_id must be a positive integer.")
     
-    # Encode the payload - we use 4 bytes for stream_id
-    payload = struct.pack("!I", stream_id)
-    payload_length = len(payload)
-    
-    # Build frame header: 1-byte frame type and 2-byte payload length.
-    frame_header = struct.pack("!BH", FRAME_TYPE_CANCEL, payload_length)
-    frame = frame_header + payload
+    # Header and 4-byte stream_id payload are packed together in one allocation.
+    frame = _CANCEL_FRAME.pack(FRAME_TYPE_CANCEL, 4, stream_id)
     
-    logger.info("Constructed CANCEL frame for stream %d: %s", stream_id, frame.hex())
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Constructed CANCEL frame for stream %d: %s", stream_id, frame.hex())
     return frame
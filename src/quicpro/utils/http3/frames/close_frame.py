@@ -7,18 +7,22 @@ Frame Format:
 """
 
 import struct
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
+from typing import Union
+from .text import validate_utf8
+
+_ERROR_CODE = struct.Struct("!I")
 
 class CloseFrame(BaseModel):
     error_code: int
     reason: str
 
-def handle_close_frame(payload: bytes) -> bytes:
+def handle_close_frame(payload: Union[bytes, memoryview]) -> bytes:
     """
     Process a CLOSE frame payload.
     
     Args:
-        payload (bytes): The CLOSE frame payload.
+        payload (bytes or memoryview): The CLOSE frame payload.
         
     Returns:
         bytes: A canonical representation of the CLOSE frame.
@@ -28,13 +32,9 @@ def handle_close_frame(payload: bytes) -> bytes:
     """
     if len(payload) < 4:
         raise ValueError("Payload too short for CLOSE frame.")
-    error_code = int.from_bytes(payload[:4], byteorder="big")
+    (error_code,) = _ERROR_CODE.unpack_from(payload, 0)
     try:
-        reason = payload[4:].decode("utf-8")
+        reason = validate_utf8(payload[4:])
     except UnicodeDecodeError as e:
         raise ValueError(f"Invalid UTF-8 encoding in reason: {e}") from e
-    try:
-        frame = CloseFrame(error_code=error_code, reason=reason)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in CLOSE frame: {e}") from e
-    return f"CLOSE({frame.error_code},{frame.reason})".encode("utf-8")
+    return b"CLOSE(%d,%b)" % (error_code, reason)
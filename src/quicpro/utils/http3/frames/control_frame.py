@@ -6,19 +6,20 @@ Frame Format:
   - remaining bytes: control_data (UTF-8 encoded string)
 """
 
-import struct
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
+from typing import Union
+from .text import validate_utf8
 
 class ControlFrame(BaseModel):
     control_code: int
     data: str
 
-def handle_control_frame(payload: bytes) -> bytes:
+def handle_control_frame(payload: Union[bytes, memoryview]) -> bytes:
     """
     Process a CONTROL frame payload.
     
     Args:
-        payload (bytes): The CONTROL frame payload.
+        payload (bytes or memoryview): The CONTROL frame payload.
         
     Returns:
         bytes: A canonical representation of the CONTROL frame.
@@ -30,11 +31,7 @@ def handle_control_frame(payload: bytes) -> bytes:
         raise ValueError("Payload too short for CONTROL frame.")
     control_code = payload[0]
     try:
-        data = payload[1:].decode("utf-8")
+        data = validate_utf8(payload[1:])
     except UnicodeDecodeError as e:
         raise ValueError(f"Invalid UTF-8 encoding in CONTROL frame: {e}") from e
-    try:
-        frame = ControlFrame(control_code=control_code, data=data)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in CONTROL frame: {e}") from e
-    return f"CONTROL({frame.control_code},{frame.data})".encode("utf-8")
+    return b"CONTROL(%d,%b)" % (control_code, data)
@@ -1,40 +1,30 @@
 """
-Production-Ready ERROR Frame Handler
+Production-Ready DATA Frame Handler
 
 Frame Format:
-  - 4 bytes: error_code (big-endian)
-  - remaining bytes: error_message (UTF-8 encoded)
+  - 4 bytes: stream_id (big-endian)
+  - remaining bytes: data (opaque; forwarded to the stream by the connection)
 """
 
 import struct
-from pydantic import BaseModel, ValidationError
+from typing import Union
 
-class ErrorFrame(BaseModel):
-    error_code: int
-    error_message: str
+_STREAM_ID = struct.Struct("!I")
 
-def handle_error_frame(payload: bytes) -> bytes:
+def handle_data_frame(payload: Union[bytes, memoryview]) -> bytes:
     """
-    Process an ERROR frame payload.
-    
+    Process a DATA frame payload.
+
     Args:
-        payload (bytes): The payload of the ERROR frame.
-        
+        payload (bytes or memoryview): The payload of the DATA frame.
+
     Returns:
-        bytes: A canonical representation of the ERROR frame.
-        
+        bytes: A canonical representation of the DATA frame (stream id and data length).
+
     Raises:
         ValueError: If the payload is invalid.
     """
     if len(payload) < 4:
-        raise ValueError("Payload too short for ERROR frame.")
-    error_code = int.from_bytes(payload[:4], byteorder="big")
-    try:
-        error_message = payload[4:].decode("utf-8")
-    except UnicodeDecodeError as e:
-        raise ValueError(f"UTF-8 decode error in ERROR frame: {e}") from e
-    try:
-        frame = ErrorFrame(error_code=error_code, error_message=error_message)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in ERROR frame: {e}") from e
-    return f"ERROR({frame.error_code},{frame.error_message})".encode("utf-8")
\ No newline at end of file
+        raise ValueError("Payload too short for DATA frame.")
+    (stream_id,) = _STREAM_ID.unpack_from(payload, 0)
+    return b"DATA(%d,%d)" % (stream_id, len(payload) - 4)
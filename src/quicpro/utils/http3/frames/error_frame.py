@@ -0,0 +1,40 @@
+"""
+Production-Ready ERROR Frame Handler
+
+Frame Format:
+  - 4 bytes: error_code (big-endian)
+  - remaining bytes: error_message (UTF-8 encoded)
+"""
+
+import struct
+from pydantic import BaseModel
+from typing import Union
+from .text import validate_utf8
+
+_ERROR_CODE = struct.Struct("!I")
+
+class ErrorFrame(BaseModel):
+    error_code: int
+    error_message: str
+
+def handle_error_frame(payload: Union[bytes, memoryview]) -> bytes:
+    """
+    Process an ERROR frame payload.
+    
+    Args:
+        payload (bytes or memoryview): The payload of the ERROR frame.
+        
+    Returns:
+        bytes: A canonical representation of the ERROR frame.
+        
+    Raises:
+        ValueError: If the payload is invalid.
+    """
+    if len(payload) < 4:
+        raise ValueError("Payload too short for ERROR frame.")
+    (error_code,) = _ERROR_CODE.unpack_from(payload, 0)
+    try:
+        error_message = validate_utf8(payload[4:])
+    except UnicodeDecodeError as e:
+        raise ValueError(f"UTF-8 decode error in ERROR frame: {e}") from e
+    return b"ERROR(%d,%b)" % (error_code, error_message)
\ No newline at end of file
@@ -8,24 +8,23 @@ Frame Format:
 """
 
 import struct
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
+from typing import Union
+from .text import validate_utf8
+
+_STREAM_ID_AND_ERROR_CODE = struct.Struct("!II")
 
 class GoAwayFrame(BaseModel):
     last_stream_id: int
     error_code: int
     reason: str
 
-def handle_goaway_frame(payload: bytes) -> bytes:
+def handle_goaway_frame(payload: Union[bytes, memoryview]) -> bytes:
     if len(payload) < 8:
         raise ValueError("Payload too short for GOAWAY frame.")
-    last_stream_id = int.from_bytes(payload[:4], byteorder="big")
-    error_code = int.from_bytes(payload[4:8], byteorder="big")
+    last_stream_id, error_code = _STREAM_ID_AND_ERROR_CODE.unpack_from(payload, 0)
     try:
-        reason = payload[8:].decode("utf-8")
+        reason = validate_utf8(payload[8:])
     except UnicodeDecodeError as e:
         raise ValueError(f"UTF-8 decode error in GOAWAY frame: {e}") from e
-    try:
-        frame = GoAwayFrame(last_stream_id=last_stream_id, error_code=error_code, reason=reason)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in GOAWAY frame: {e}") from e
-    return f"GOAWAY({frame.last_stream_id},{frame.error_code},{frame.reason})".encode("utf-8")
+    return b"GOAWAY(%d,%d,%b)" % (last_stream_id, error_code, reason)
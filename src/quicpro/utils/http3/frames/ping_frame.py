@@ -6,18 +6,21 @@ Frame Format:
 """
 
 import logging
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
+from typing import Union
+from .text import validate_utf8
+
+# Result for an empty (keepalive) PING, the common case, returned without any work.
+_EMPTY_PING = b"PING()"
 
 class PingFrame(BaseModel):
     data: str = ""
 
-def handle_ping_frame(payload: bytes) -> bytes:
+def handle_ping_frame(payload: Union[bytes, memoryview]) -> bytes:
+    if not payload:
+        return _EMPTY_PING
     try:
-        data = payload.decode("utf-8") if payload else ""
+        data = validate_utf8(payload)
     except UnicodeDecodeError as e:
         raise ValueError(f"UTF-8 decode error in PING frame: {e}") from e
-    try:
-        frame = PingFrame(data=data)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in PING frame: {e}") from e
-    return f"PING({frame.data})".encode("utf-8")
+    return b"PING(%b)" % data
@@ -1,25 +1,18 @@
 """
-Production-Ready PRIORITY UPDATE Frame Handler
+Production-Ready PRIORITY Frame Handler
 
 Frame Format:
   - 4 bytes: stream_id (big-endian)
-  - 1 byte: updated_priority_weight (unsigned integer)
+  - 1 byte: priority_weight (unsigned integer)
 """
 
 import struct
-from pydantic import BaseModel, ValidationError
+from typing import Union
 
-class PriorityUpdateFrame(BaseModel):
-    stream_id: int
-    updated_priority_weight: int
+_STREAM_ID_AND_WEIGHT = struct.Struct("!IB")
 
-def handle_priority_update_frame(payload: bytes) -> bytes:
+def handle_priority_frame(payload: Union[bytes, memoryview]) -> bytes:
     if len(payload) < 5:
-        raise ValueError("Payload too short for PRIORITY UPDATE frame.")
-    stream_id = int.from_bytes(payload[:4], byteorder="big")
-    updated_priority_weight = payload[4]
-    try:
-        frame = PriorityUpdateFrame(stream_id=stream_id, updated_priority_weight=updated_priority_weight)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in PRIORITY UPDATE frame: {e}") from e
-    return f"PRIORITY_UPDATE({frame.stream_id},{frame.updated_priority_weight})".encode("utf-8")
+        raise ValueError("Payload too short for PRIORITY frame.")
+    stream_id, priority_weight = _STREAM_ID_AND_WEIGHT.unpack_from(payload, 0)
+    return b"PRIORITY(%d,%d)" % (stream_id, priority_weight)
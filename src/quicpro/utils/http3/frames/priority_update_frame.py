@@ -0,0 +1,23 @@
+"""
+Production-Ready PRIORITY UPDATE Frame Handler
+
+Frame Format:
+  - 4 bytes: stream_id (big-endian)
+  - 1 byte: updated_priority_weight (unsigned integer)
+"""
+
+import struct
+from pydantic import BaseModel
+from typing import Union
+
+_STREAM_ID_AND_WEIGHT = struct.Struct("!IB")
+
+class PriorityUpdateFrame(BaseModel):
+    stream_id: int
+    updated_priority_weight: int
+
+def handle_priority_update_frame(payload: Union[bytes, memoryview]) -> bytes:
+    if len(payload) < 5:
+        raise ValueError("Payload too short for PRIORITY UPDATE frame.")
+    stream_id, updated_priority_weight = _STREAM_ID_AND_WEIGHT.unpack_from(payload, 0)
+    return b"PRIORITY_UPDATE(%d,%d)" % (stream_id, updated_priority_weight)
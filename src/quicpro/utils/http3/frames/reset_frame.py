@@ -7,19 +7,17 @@ Frame Format:
 """
 
 import struct
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
+from typing import Union
+
+_STREAM_ID_AND_ERROR_CODE = struct.Struct("!II")
 
 class ResetFrame(BaseModel):
     stream_id: int
     error_code: int
 
-def handle_reset_frame(payload: bytes) -> bytes:
+def handle_reset_frame(payload: Union[bytes, memoryview]) -> bytes:
     if len(payload) < 8:
         raise ValueError("Payload too short for RESET frame.")
-    stream_id = int.from_bytes(payload[:4], byteorder="big")
-    error_code = int.from_bytes(payload[4:8], byteorder="big")
-    try:
-        frame = ResetFrame(stream_id=stream_id, error_code=error_code)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in RESET frame: {e}") from e
-    return f"RESET({frame.stream_id},{frame.error_code})".encode("utf-8")
+    stream_id, error_code = _STREAM_ID_AND_ERROR_CODE.unpack_from(payload, 0)
+    return b"RESET(%d,%d)" % (stream_id, error_code)
@@ -6,7 +6,9 @@ Frame Format:
 """
 
 import logging
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
+from typing import Union
+from .text import decode_utf8
 
 logger = logging.getLogger(__name__)
 
@@ -15,26 +17,22 @@ class SettingsFrame(BaseModel):
 
 def parse_settings(payload_str: str) -> dict:
     settings = {}
+    # partition() splits each pair without building a list, and only the key and value
+    # are stripped, not the whole pair first.
     for pair in payload_str.split(";"):
-        pair = pair.strip()
-        if not pair:
+        key, separator, value = pair.partition("=")
+        if not separator:
+            if pair.strip():
+                raise ValueError(f"Invalid settings pair: {pair.strip()}")
             continue
-        if "=" not in pair:
-            raise ValueError(f"Invalid settings pair: {pair}")
-        key, value = pair.split("=", 1)
         settings[key.strip()] = value.strip()
     return settings
 
-def handle_settings_frame(payload: bytes) -> bytes:
+def handle_settings_frame(payload: Union[bytes, memoryview]) -> bytes:
     if not payload:
         raise ValueError("Empty payload in SETTINGS frame.")
     try:
-        payload_str = payload.decode("utf-8")
+        payload_str = decode_utf8(payload)
     except UnicodeDecodeError as e:
         raise ValueError(f"UTF-8 decode error in SETTINGS frame: {e}") from e
-    settings_dict = parse_settings(payload_str)
-    try:
-        frame = SettingsFrame(settings=settings_dict)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in SETTINGS frame: {e}") from e
-    return f"SETTINGS({frame.settings})".encode("utf-8")
+    return f"SETTINGS({parse_settings(payload_str)})".encode("utf-8")
@@ -0,0 +1,33 @@
+"""
+Text helpers for HTTP/3 frame payloads.
+
+Reason phrases, messages and settings are almost always plain ASCII. bytes.isascii()
+is a single C-level scan, and ASCII bytes need no UTF-8 decoding: decode_utf8 uses the
+ASCII codec for them, and validate_utf8 accepts them without decoding at all.
+Both also take memoryviews, which have no isascii() and are decoded with str() instead.
+"""
+from typing import Union
+
+
+def decode_utf8(data: Union[bytes, memoryview]) -> str:
+    """
+    Decode UTF-8 frame text, taking the ASCII fast path when possible.
+
+    Raises:
+        UnicodeDecodeError: If data is not valid UTF-8.
+    """
+    if type(data) is bytes and data.isascii():
+        return data.decode("ascii")
+    return str(data, "utf-8")
+
+
+def validate_utf8(data: Union[bytes, memoryview]) -> Union[bytes, memoryview]:
+    """
+    Return data unchanged after checking that it is valid UTF-8.
+
+    Raises:
+        UnicodeDecodeError: If data is not valid UTF-8.
+    """
+    if type(data) is not bytes or not data.isascii():
+        str(data, "utf-8")
+    return data
@@ -5,17 +5,15 @@ Frame Format:
   - Payload: Raw bytes whose structure is unknown.
 """
 
+import binascii
 import logging
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
+from typing import Union
 
 logger = logging.getLogger(__name__)
 
 class UnknownFrame(BaseModel):
     payload: bytes
 
-def handle_unknown_frame(payload: bytes) -> bytes:
-    try:
-        frame = UnknownFrame(payload=payload)
-    except ValidationError as e:
-        raise ValueError(f"Validation error in UNKNOWN frame: {e}") from e
-    return f"UNKNOWN({frame.payload.hex()})".encode("utf-8")
+def handle_unknown_frame(payload: Union[bytes, memoryview]) -> bytes:
+    return b"UNKNOWN(%b)" % binascii.hexlify(payload)
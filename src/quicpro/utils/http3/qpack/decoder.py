@@ -98,8 +98,8 @@ class QPACKDecoder:
                 continue
             # Indexed header field representation (high bit set).
             if current_byte & 0x80:
-                index, n = decode_integer(
-                    bytes([current_byte & 0x7F]) + block[pos+1:], 6)
+                # The 6-bit prefix mask already drops the indexed-field bit.
+                index, n = decode_integer(block, 6, pos)
                 pos += n
                 if index <= len(STATIC_TABLE):
                     name, value = STATIC_TABLE[index - 1]
@@ -127,8 +127,7 @@ class QPACKDecoder:
                 if flag == self.LITERAL_WITH_INCREMENTAL_INDEXING:
                     self.dynamic_table.add(name, value)
             # Continue until the entire block is processed.
-        if self.auditing:
-            checksum = _calculate_checksum(block)
-            logger.info("Decoded QPACK header block checksum: %s", checksum)
+        if self.auditing and logger.isEnabledFor(logging.INFO):
+            logger.info("Decoded QPACK header block checksum: %s", _calculate_checksum(block))
         return headers
 
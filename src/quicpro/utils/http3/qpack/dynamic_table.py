@@ -3,10 +3,12 @@ Dynamic Table Management for QPACK
 
 This module defines the DynamicTable class which manages header field entries.
 It supports insertion and eviction based on the total octet consumption, following RFC 9204.
+A dictionary keyed by (lowercased name, value) gives the encoder O(1) lookups of entries.
 """
 
 import logging
-from typing import List, Tuple
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +26,10 @@ def header_field_size(name: str, value: str) -> int:
     Returns:
         int: The size in octets.
     """
-    return len(name.encode("utf-8")) + len(value.encode("utf-8")) + 32
+    # ASCII strings (nearly all header fields) have as many octets as characters.
+    name_size = len(name) if name.isascii() else len(name.encode("utf-8"))
+    value_size = len(value) if value.isascii() else len(value.encode("utf-8"))
+    return name_size + value_size + 32
 
 
 class DynamicTable:
@@ -42,9 +47,19 @@ class DynamicTable:
         Args:
             max_size (int): Maximum allowed size in octets.
         """
-        self.entries: List[Tuple[str, str]] = []
+        # Newest entry first. A deque makes the per-insert prepend O(1); eviction pops the
+        # oldest entry from the right. Capacity is bounded in octets, so no maxlen is set.
+        self.entries: Deque[Tuple[str, str]] = deque()
         self.max_size: int = max_size
         self.current_size: int = 0
+        # Entries are numbered by insertion; the entry at (1-based) position p has
+        # number _insert_count - p + 1. The index maps each (lowercased name, value)
+        # to the number of its newest entry.
+        self._insert_count: int = 0
+        self._index: Dict[Tuple[str, str], int] = {}
+        # (index key, size) of each entry, parallel to entries, so eviction neither
+        # lowercases nor re-measures the evicted field.
+        self._entry_info: Deque[Tuple[Tuple[str, str], int]] = deque()
 
     def _evict_entries(self, required_space: int) -> None:
         """
@@ -57,8 +72,12 @@ class DynamicTable:
             RuntimeError: If the header field size exceeds the maximum table size.
         """
         while (self.current_size + required_space > self.max_size) and self.entries:
+            evicted_number = self._insert_count - len(self.entries) + 1
             evicted_name, evicted_value = self.entries.pop()
-            evicted_size = header_field_size(evicted_name, evicted_value)
+            key, evicted_size = self._entry_info.pop()
+            # Only drop the index entry if no newer duplicate has replaced it.
+            if self._index.get(key) == evicted_number:
+                del self._index[key]
             self.current_size -= evicted_size
             logger.debug("Evicted header [%s: %s] (size: %d) from dynamic table",
                          evicted_name, evicted_value, evicted_size)
@@ -76,17 +95,37 @@ class DynamicTable:
         """
         size = header_field_size(name, value)
         self._evict_entries(size)
-        self.entries.insert(0, (name, value))
+        self.entries.appendleft((name, value))
+        key = (name.lower(), value)
+        self._entry_info.appendleft((key, size))
+        self._insert_count += 1
+        self._index[key] = self._insert_count
         self.current_size += size
         logger.debug("Added header [%s: %s] (size: %d) to dynamic table (current size: %d)",
                      name, value, size, self.current_size)
 
-    def get_entries(self) -> List[Tuple[str, str]]:
+    def index_of(self, name: str, value: str) -> Optional[int]:
+        """
+        Find the newest entry matching a header field, comparing names case-insensitively.
+
+        Args:
+            name (str): Header field name.
+            value (str): Header field value.
+
+        Returns:
+            Optional[int]: The 1-based position of the entry (newest first), or None if absent.
+        """
+        number = self._index.get((name.lower(), value))
+        if number is None:
+            return None
+        return self._insert_count - number + 1
+
+    def get_entries(self) -> Deque[Tuple[str, str]]:
         """
         Retrieve all current entries from the dynamic table.
 
         Returns:
-            List[Tuple[str, str]]: List of header field entries.
+            Deque[Tuple[str, str]]: Header field entries, newest first.
         """
         return self.entries
 
@@ -7,27 +7,78 @@ It supports:
   - Header field indexing with both a static table and a production-grade dynamic table.
   - Literal header field encoding with Huffman encoding (using a production-ready Huffman encoder).
   - Optional round-trip audit verification to ensure that headers encode and decode correctly.
+    The audit decodes each block with a decoder kept alongside the encoder, so its dynamic
+    table follows the encoder's across calls.
+  - A process-wide LRU cache of encoded literal strings (ENCODED_STRING_CACHE_SIZE entries),
+    so names and values that repeat across requests and encoders skip the Huffman bit loop.
+  - Header blocks that bypass the dynamic table (indexing=False), for blocks reused across
+    requests and connections.
+  - Raw (non-Huffman) literal strings where Huffman would not pay off: strings shorter
+    than HUFFMAN_MIN_LENGTH, and strings whose Huffman form is no shorter than the raw one.
+    The H bit of the length prefix tells the decoder which form follows.
   
 The API is designed for production use; no "simulate" keyword is accepted.
 """
 
+import functools
 import logging
 import hashlib
 from typing import Dict, Tuple
 
 from .varint import encode_integer
-from .static_table import STATIC_TABLE
+from .static_table import STATIC_INDEX, STATIC_TABLE
 from .dynamic_table import DynamicTable
-from .huffman import huffman_encode
+from .huffman import huffman_encode, huffman_encoded_length
 from .decoder import QPACKDecoder
 
 logger = logging.getLogger(__name__)
 
+# Strings shorter than this are sent raw; the bit-by-bit Huffman encoding costs more
+# than the few bytes it could save.
+HUFFMAN_MIN_LENGTH = 20
+
+# H bits marking a Huffman-encoded name (5-bit length prefix) and value (7-bit length prefix).
+NAME_HUFFMAN_FLAG = 0x20
+VALUE_HUFFMAN_FLAG = 0x80
+
+# Distinct (string, prefix, flag) encodings kept by _encode_string's LRU cache.
+ENCODED_STRING_CACHE_SIZE = 4096
+
+
+def _indexed(index: int) -> bytes:
+    """Encode a table index as an indexed field line (6-bit prefix, high bit set)."""
+    encoded = bytearray(encode_integer(index, 6))
+    encoded[0] |= 0x80
+    return bytes(encoded)
+
+
+# Indexed representation of each static entry, by 0-based position; they never change.
+_STATIC_INDEXED = [_indexed(index) for index in range(1, len(STATIC_TABLE) + 1)]
+
 
 def _calculate_checksum(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+@functools.lru_cache(maxsize=ENCODED_STRING_CACHE_SIZE)
+def _encode_string(data: str, prefix_bits: int, huffman_flag: int) -> bytes:
+    """
+    Encode a length-prefixed literal string, Huffman-encoded only when that makes it shorter.
+
+    The result depends only on the arguments, so it is cached across calls and encoders.
+
+    Raises:
+        ValueError: If data has characters outside the Huffman table (latin-1).
+    """
+    if len(data) >= HUFFMAN_MIN_LENGTH and huffman_encoded_length(data) < len(data):
+        encoded = huffman_encode(data)
+        length = bytearray(encode_integer(len(encoded), prefix_bits))
+        length[0] |= huffman_flag
+        return bytes(length) + encoded
+    encoded = data.encode("latin-1")
+    return encode_integer(len(encoded), prefix_bits) + encoded
+
+
 class QPACKEncoder:
     def __init__(self, max_dynamic_table_size: int = 4096, auditing: bool = False) -> None:
         """
@@ -39,6 +90,8 @@ class QPACKEncoder:
         """
         self.auditing = auditing
         self.dynamic_table = DynamicTable(max_dynamic_table_size)
+        # Mirrors the peer's decoder state for the round-trip audit.
+        self._audit_decoder = QPACKDecoder(max_dynamic_table_size) if auditing else None
         if self.auditing:
             logger.info("QPACK Encoder auditing is ENABLED.")
 
@@ -50,18 +103,15 @@ class QPACKEncoder:
             Tuple[bool, int]: (True, index) if the header is found (1-based index);
                               (False, 0) if not found.
         """
-        normalized_name = name.lower()
-        # Search in the static table.
-        for idx, (n, v) in enumerate(STATIC_TABLE, start=1):
-            if n.lower() == normalized_name and v == value:
-                logger.debug("Found header [%s: %s] in static table at index %d", name, value, idx)
-                return True, idx
-        # Search in the dynamic table.
-        base = len(STATIC_TABLE)
-        for idx, (n, v) in enumerate(self.dynamic_table.entries, start=1):
-            if n.lower() == normalized_name and v == value:
-                logger.debug("Found header [%s: %s] in dynamic table at index %d", name, value, base + idx)
-                return True, base + idx
+        idx = STATIC_INDEX.get((name.lower(), value))
+        if idx is not None:
+            logger.debug("Found header [%s: %s] in static table at index %d", name, value, idx)
+            return True, idx
+        idx = self.dynamic_table.index_of(name, value)
+        if idx is not None:
+            idx += len(STATIC_TABLE)
+            logger.debug("Found header [%s: %s] in dynamic table at index %d", name, value, idx)
+            return True, idx
         return False, 0
 
     def _encode_literal(self, name: str, value: str, representation_flag: int = 0x00) -> bytes:
@@ -77,31 +127,29 @@ class QPACKEncoder:
         Returns:
             bytes: The encoded literal header field.
         """
-        encoded = bytearray([representation_flag])
         try:
-            encoded_name = huffman_encode(name)
+            encoded_name = _encode_string(name, 5, NAME_HUFFMAN_FLAG)
         except Exception as e:
-            logger.error("Huffman encoding failed for header name '%s': %s", name, e)
+            logger.error("Encoding failed for header name '%s': %s", name, e)
             raise
-        encoded += encode_integer(len(encoded_name), 5)
-        encoded += encoded_name
         try:
-            encoded_value = huffman_encode(value)
+            encoded_value = _encode_string(value, 7, VALUE_HUFFMAN_FLAG)
         except Exception as e:
-            logger.error("Huffman encoding failed for header value '%s': %s", value, e)
+            logger.error("Encoding failed for header value '%s': %s", value, e)
             raise
-        encoded += encode_integer(len(encoded_value), 7)
-        encoded += encoded_value
-        logger.debug("Encoded literal header [%s: %s] with flag 0x%02x (name: %d bytes, value: %d bytes)",
-                     name, value, representation_flag, len(encoded_name), len(encoded_value))
-        return bytes(encoded)
+        logger.debug("Encoded literal header [%s: %s] with flag 0x%02x (value: %d bytes)",
+                     name, value, representation_flag, len(encoded_value))
+        return bytes([representation_flag]) + encoded_name + encoded_value
 
-    def encode(self, headers: Dict[str, str]) -> bytes:
+    def encode(self, headers: Dict[str, str], indexing: bool = True) -> bytes:
         """
         Encode a dictionary of HTTP headers into a QPACK header block.
 
         Args:
             headers (Dict[str, str]): The headers to encode.
+            indexing (bool): If False, only the static table is referenced and every other
+                             field is sent as a never-indexed literal, so the block neither
+                             reads nor changes the dynamic table and can be reused as is.
 
         Returns:
             bytes: QPACK header block with a 2-byte big-endian length prefix.
@@ -109,18 +157,23 @@ class QPACKEncoder:
         header_block = bytearray()
         for name, value in headers.items():
             # Attempt to find the header in static or dynamic table.
-            found, index = self._find_header_field(name, value)
+            if indexing:
+                found, index = self._find_header_field(name, value)
+            else:
+                index = STATIC_INDEX.get((name.lower(), value), 0)
+                found = index > 0
             if found:
-                # Encode the index using a 6-bit prefix.
-                encoded_index = bytearray(encode_integer(index, 6))
-                # Set the high-order bit for static table indexing.
                 if index <= len(STATIC_TABLE):
-                    encoded_index[0] |= 0x80
+                    header_block += _STATIC_INDEXED[index - 1]
                     logger.debug("Encoded header [%s: %s] as static indexed (index=%d)", name, value, index)
-                header_block.extend(encoded_index)
+                else:
+                    # Dynamic entries share the static entries' index space, so they need the
+                    # same indexed-field bit; without it the decoder reads a literal or a
+                    # table size update.
+                    header_block += _indexed(index)
             else:
                 # For sensitive headers, use never-indexed representation.
-                if name.lower() in {"authorization", "cookie"}:
+                if not indexing or name.lower() in {"authorization", "cookie"}:
                     literal = self._encode_literal(name, value, representation_flag=0x10)
                 else:
                     literal = self._encode_literal(name, value, representation_flag=0x00)
@@ -129,17 +182,24 @@ class QPACKEncoder:
                 header_block.extend(literal)
         block_bytes = bytes(header_block)
         total_length = len(block_bytes)
-        checksum = _calculate_checksum(block_bytes)
-        logger.info("QPACK header block generated (length=%d, checksum=%s)", total_length, checksum)
+        if self.auditing and logger.isEnabledFor(logging.INFO):
+            # The checksum only serves the audit log, so it is not computed otherwise.
+            logger.info("QPACK header block generated (length=%d, checksum=%s)",
+                        total_length, _calculate_checksum(block_bytes))
+        else:
+            logger.debug("QPACK header block generated (length=%d)", total_length)
+        # Prepend the block length as a 2-byte big-endian integer.
+        prefixed_block = total_length.to_bytes(2, byteorder="big") + block_bytes
         if self.auditing:
-            decoder = QPACKDecoder()
-            decoded_headers = decoder.decode(block_bytes)
+            decoded_headers = self._audit_decoder.decode(prefixed_block)
+            # Indexed fields decode with the table's spelling of the name, so names
+            # are compared case-insensitively, as they are matched when encoding.
+            decoded_headers = {key.lower(): value for key, value in decoded_headers.items()}
             for key, orig_value in headers.items():
-                dec_value = decoded_headers.get(key)
+                dec_value = decoded_headers.get(key.lower())
                 if dec_value != orig_value:
                     logger.error("Round-trip audit failed for header '%s': original=%r, decoded=%r",
                                  key, orig_value, dec_value)
                     raise RuntimeError("QPACK round-trip verification failed during auditing.")
             logger.info("QPACK round-trip verification succeeded.")
-        # Prepend the block length as a 2-byte big-endian integer.
-        return total_length.to_bytes(2, byteorder="big") + block_bytes
+        return prefixed_block
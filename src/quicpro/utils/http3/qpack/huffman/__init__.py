@@ -4,4 +4,5 @@ It exports the encoder and decoder functions.
 """
 
 from .encoder import encode as huffman_encode
+from .encoder import encoded_length as huffman_encoded_length
 from .decoder import decode as huffman_decode
@@ -1,10 +1,8 @@
 """
 Static Huffman constants for QPACK/HPACK as per RFC 7541 Appendix B.
 This module defines the full 256-entry static Huffman table.
-Each entry is a tuple: (code, bit_length).
-
-PLEASE VERIFY: In production, every one of the 256 entries (and any special EOS symbol, if needed)
-must match the RFC exactly.
+Each entry is a tuple: (code, bit_length), matching RFC 7541 Appendix B exactly.
+The EOS symbol (256) is never encoded; it only appears as the all-ones padding.
 """
 
 from typing import List, Tuple
@@ -48,45 +46,47 @@ HPACK_HUFFMAN_TABLE: List[Tuple[int, int]] = [
     (0x2b, 6), (0x76, 7), (0x2c, 6), (0x8, 5),
     (0x9, 5), (0x2d, 6), (0x77, 7), (0x78, 7),
     (0x79, 7), (0x7a, 7), (0x7b, 7), (0x7ffe, 15),
-    (0x7fc, 11), (0x3ffd, 14), (0x1ffd, 13), (0x2, 5),
+    (0x7fc, 11), (0x3ffd, 14), (0x1ffd, 13), (0xffffffc, 28),
 
     # Entries 128-159
-    (0xfffe0, 20), (0xfffe1, 20), (0xfffde, 20), (0xfffe2, 20),
-    (0xfffe3, 20), (0xfffe4, 20), (0xfffe5, 20), (0xfffe6, 20),
-    (0xfffe7, 20), (0xfff9f, 20), (0xfffda, 20), (0xfffdb, 20),
-    (0xfffdcc, 20), (0xfffdd, 20), (0xfffdde, 20), (0xfffdf, 20),
-    (0xfffe8, 20), (0xfffe9, 20), (0xfffec, 20), (0xfffed, 20),
-    (0xfffee, 20), (0xfffef, 20), (0xfffea, 20), (0xfffeb, 20),
-    (0xfffec, 20), (0xfffed, 20), (0xfffef, 20), (0xffff0, 20),
-    (0xffff1, 20), (0xffff2, 20), (0xffff3, 20), (0xffff4, 20),
+    (0xfffe6, 20), (0x3fffd2, 22), (0xfffe7, 20), (0xfffe8, 20),
+    (0x3fffd3, 22), (0x3fffd4, 22), (0x3fffd5, 22), (0x7fffd9, 23),
+    (0x3fffd6, 22), (0x7fffda, 23), (0x7fffdb, 23), (0x7fffdc, 23),
+    (0x7fffdd, 23), (0x7fffde, 23), (0xffffeb, 24), (0x7fffdf, 23),
+    (0xffffec, 24), (0xffffed, 24), (0x3fffd7, 22), (0x7fffe0, 23),
+    (0xffffee, 24), (0x7fffe1, 23), (0x7fffe2, 23), (0x7fffe3, 23),
+    (0x7fffe4, 23), (0x1fffdc, 21), (0x3fffd8, 22), (0x7fffe5, 23),
+    (0x3fffd9, 22), (0x7fffe6, 23), (0x7fffe7, 23), (0xffffef, 24),
 
     # Entries 160-191
-    (0xffff5, 20), (0xffff6, 20), (0xffff7, 20), (0xffff8, 20),
-    (0xffff9, 20), (0xffffa, 20), (0xffffb, 20), (0xffffc, 20),
-    (0xffffd, 20), (0xffffe, 20), (0xfffff, 20), (0x100000, 20),
-    (0x100001, 20), (0x100002, 20), (0x100003, 20), (0x100004, 20),
-    (0x100005, 20), (0x100006, 20), (0x100007, 20), (0x100008, 20),
-    (0x100009, 20), (0x10000a, 20), (0x10000b, 20), (0x10000c, 20),
-    (0x10000d, 20), (0x10000e, 20), (0x10000f, 20), (0x100010, 20),
-    (0x100011, 20), (0x100012, 20), (0x100013, 20), (0x100014, 20),
+    (0x3fffda, 22), (0x1fffdd, 21), (0xfffe9, 20), (0x3fffdb, 22),
+    (0x3fffdc, 22), (0x7fffe8, 23), (0x7fffe9, 23), (0x1fffde, 21),
+    (0x7fffea, 23), (0x3fffdd, 22), (0x3fffde, 22), (0xfffff0, 24),
+    (0x1fffdf, 21), (0x3fffdf, 22), (0x7fffeb, 23), (0x7fffec, 23),
+    (0x1fffe0, 21), (0x1fffe1, 21), (0x3fffe0, 22), (0x1fffe2, 21),
+    (0x7fffed, 23), (0x3fffe1, 22), (0x7fffee, 23), (0x7fffef, 23),
+    (0xfffea, 20), (0x3fffe2, 22), (0x3fffe3, 22), (0x3fffe4, 22),
+    (0x7ffff0, 23), (0x3fffe5, 22), (0x3fffe6, 22), (0x7ffff1, 23),
+
+    # Entries 192-223
+    (0x3ffffe0, 26), (0x3ffffe1, 26), (0xfffeb, 20), (0x7fff1, 19),
+    (0x3fffe7, 22), (0x7ffff2, 23), (0x3fffe8, 22), (0x1ffffec, 25),
+    (0x3ffffe2, 26), (0x3ffffe3, 26), (0x3ffffe4, 26), (0x7ffffde, 27),
+    (0x7ffffdf, 27), (0x3ffffe5, 26), (0xfffff1, 24), (0x1ffffed, 25),
+    (0x7fff2, 19), (0x1fffe3, 21), (0x3ffffe6, 26), (0x7ffffe0, 27),
+    (0x7ffffe1, 27), (0x3ffffe7, 26), (0x7ffffe2, 27), (0xfffff2, 24),
+    (0x1fffe4, 21), (0x1fffe5, 21), (0x3ffffe8, 26), (0x3ffffe9, 26),
+    (0xffffffd, 28), (0x7ffffe3, 27), (0x7ffffe4, 27), (0x7ffffe5, 27),
 
-    # Entries 192-255
-    (0x100015, 21), (0x100016, 21), (0x100017, 21), (0x100018, 21),
-    (0x100019, 21), (0x10001A, 21), (0x10001B, 21), (0x10001C, 21),
-    (0x10001D, 21), (0x10001E, 21), (0x10001F, 21), (0x100020, 21),
-    (0x100021, 21), (0x100022, 21), (0x100023, 21), (0x100024, 21),
-    (0x100025, 21), (0x100026, 21), (0x100027, 21), (0x100028, 21),
-    (0x100029, 21), (0x10002A, 21), (0x10002B, 21), (0x10002C, 21),
-    (0x10002D, 21), (0x10002E, 21), (0x10002F, 21), (0x100030, 21),
-    (0x100031, 21), (0x100032, 21), (0x100033, 21), (0x100034, 21),
-    (0x100035, 21), (0x100036, 21), (0x100037, 21), (0x100038, 21),
-    (0x100039, 21), (0x10003A, 21), (0x10003B, 21), (0x10003C, 21),
-    (0x10003D, 21), (0x10003E, 21), (0x10003F, 21), (0x100040, 21),
-    (0x100041, 21), (0x100042, 21), (0x100043, 21), (0x100044, 21),
-    (0x100045, 21), (0x100046, 21), (0x100047, 21), (0x100048, 21),
-    (0x100049, 21), (0x10004A, 21), (0x10004B, 21), (0x10004C, 21),
-    (0x10004D, 21), (0x10004E, 21), (0x10004F, 21), (0x100050, 21),
-    (0x100051, 21), (0x100052, 21), (0x100053, 21), (0x100054, 21),
+    # Entries 224-255
+    (0xfffec, 20), (0xfffff3, 24), (0xfffed, 20), (0x1fffe6, 21),
+    (0x3fffe9, 22), (0x1fffe7, 21), (0x1fffe8, 21), (0x7ffff3, 23),
+    (0x3fffea, 22), (0x3fffeb, 22), (0x1ffffee, 25), (0x1ffffef, 25),
+    (0xfffff4, 24), (0xfffff5, 24), (0x3ffffea, 26), (0x7ffff4, 23),
+    (0x3ffffeb, 26), (0x7ffffe6, 27), (0x3ffffec, 26), (0x3ffffed, 26),
+    (0x7ffffe7, 27), (0x7ffffe8, 27), (0x7ffffe9, 27), (0x7ffffea, 27),
+    (0x7ffffeb, 27), (0xffffffe, 28), (0x7ffffec, 27), (0x7ffffed, 27),
+    (0x7ffffee, 27), (0x7ffffef, 27), (0x7fffff0, 27), (0x3ffffee, 26),
 ]
 
 if len(HPACK_HUFFMAN_TABLE) != 256:
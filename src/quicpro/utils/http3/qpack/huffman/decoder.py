@@ -1,11 +1,14 @@
 """
 QPACK Huffman Decoder for HTTP/3.
 
-This module implements Huffman decoding using a decoding tree built from the static Huffman table.
+This module implements Huffman decoding with a table-driven state machine built from the
+static Huffman table. Each state is an inner node of the decoding tree, and the table maps
+a state and the next 4 input bits to the symbols completed on the way and the state reached,
+so the input is consumed a nibble at a time instead of bit by bit.
 It also validates that any leftover bits in the final byte are all ones (as required by the RFC).
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from .constants import HUFFMAN_TABLE
 
 
@@ -31,13 +34,61 @@ def build_decoding_tree() -> Dict[int, Any]:
 _DECODING_TREE = build_decoding_tree()
 
 
+def build_decoding_table(root: Dict[int, Any]) -> Tuple[List[Optional[Tuple[int, str]]], List[bool]]:
+    """
+    Build the nibble decoding table for a decoding tree.
+
+    Returns:
+        A tuple (table, padding_ok). table[state * 16 + nibble] is (next_state, emitted) or
+        None if the nibble has no branch in the tree; padding_ok[state] is True when the path
+        from the root to state consists of one bits only. State 0 is the root.
+    """
+    # Nodes whose path from the root is all ones; only these may end the input as padding.
+    all_ones = set()
+    node = root
+    while node is not None:
+        all_ones.add(id(node))
+        node = node.get(1)
+    states: List[Dict[int, Any]] = [root]
+    state_ids = {id(root): 0}
+    padding_ok = [True]
+    table: List[Optional[Tuple[int, str]]] = []
+    index = 0
+    while index < len(states):
+        state = states[index]
+        for nibble in range(16):
+            node = state
+            emitted: List[str] = []
+            for shift in (3, 2, 1, 0):
+                bit = (nibble >> shift) & 1
+                if bit not in node:
+                    node = None
+                    break
+                node = node[bit]
+                if "symbol" in node:
+                    emitted.append(chr(node["symbol"]))
+                    node = root
+            if node is None:
+                table.append(None)
+                continue
+            if id(node) not in state_ids:
+                state_ids[id(node)] = len(states)
+                states.append(node)
+                padding_ok.append(id(node) in all_ones)
+            table.append((state_ids[id(node)], "".join(emitted)))
+        index += 1
+    return table, padding_ok
+
+
+_DECODING_TABLE, _PADDING_OK = build_decoding_table(_DECODING_TREE)
+
+
 def decode(data: bytes) -> str:
     """
-    Decode Huffman encoded bytes using the decoding tree.
+    Decode Huffman encoded bytes using the nibble decoding table.
 
-    This implementation first creates a complete bitstring from the input data,
-    then processes bits one-by-one. It also tracks the position of the last complete symbol.
-    Any leftover bits (the padding) are verified to consist entirely of ones.
+    Each byte is processed as two 4-bit steps. Any leftover bits after the last complete
+    symbol (the padding) are verified to consist entirely of ones.
 
     Args:
         data (bytes): The Huffman encoded data.
@@ -48,31 +99,25 @@ def decode(data: bytes) -> str:
     Raises:
         ValueError: If the encoding is invalid or padding is incorrect.
     """
-    # Create a bit string from the bytes.
-    bit_str = "".join(f"{byte:08b}" for byte in data)
-    n = len(bit_str)
-    ptr = 0
+    table = _DECODING_TABLE
     result_chars: List[str] = []
-    node = _DECODING_TREE
-    last_complete_ptr = 0
-
-    while ptr < n:
-        bit = int(bit_str[ptr])
-        ptr += 1
-        if bit not in node:
+    append = result_chars.append
+    state = 0
+    for position, byte in enumerate(data):
+        entry = table[(state << 4) | (byte >> 4)]
+        if entry is None:
             raise ValueError(
-                f"Invalid Huffman encoding; no branch for bit at position {ptr}.")
-        node = node[bit]
-        if "symbol" in node:
-            result_chars.append(chr(node["symbol"]))
-            node = _DECODING_TREE
-            last_complete_ptr = ptr
-
-    # If the final symbol was not completed exactly at the end, verify that the leftover bits are all ones.
-    if ptr != last_complete_ptr:
-        leftover = bit_str[last_complete_ptr:ptr]
-        if any(bit != '1' for bit in leftover):
+                f"Invalid Huffman encoding; no branch for bits in byte {position}.")
+        state, emitted = entry
+        append(emitted)
+        entry = table[(state << 4) | (byte & 0x0F)]
+        if entry is None:
             raise ValueError(
-                f"Invalid Huffman padding bits; expected all ones, got {leftover}.")
-    return "".join(result_chars)
+                f"Invalid Huffman encoding; no branch for bits in byte {position}.")
+        state, emitted = entry
+        append(emitted)
 
+    if not _PADDING_OK[state]:
+        raise ValueError(
+            "Invalid Huffman padding bits; expected all ones.")
+    return "".join(result_chars)
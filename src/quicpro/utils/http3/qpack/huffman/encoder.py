@@ -2,13 +2,36 @@
 QPACK Huffman Encoder for HTTP/3.
 
 This module encodes strings using the QPACK static Huffman table.
-It accumulates bits for each character’s code and flushes the resulting bitstream into bytes,
-padding the final octet with all ones as required by the specification.
+It joins the precomputed bit string of each character's code, pads the final octet with
+all ones as required by the specification, and converts the bitstream to bytes in one step,
+so the per-bit work happens in C rather than in a Python loop.
+encoded_length() returns the size encode() would produce without building the output.
 """
 
-from typing import ByteString
+from array import array
 from .constants import HUFFMAN_TABLE
 
+# Code length in bits of each symbol, for summing without encoding.
+_CODE_LENGTHS = array("B", (HUFFMAN_TABLE[symbol][1] for symbol in range(256)))
+
+# Code of each symbol as a string of '0'/'1' characters of its exact bit length.
+_CODE_BITS = tuple(format(code, "0%db" % nbits)
+                   for code, nbits in (HUFFMAN_TABLE[symbol] for symbol in range(256)))
+
+
+def encoded_length(data: str) -> int:
+    """
+    Return the length in bytes of encode(data), including padding.
+
+    Raises:
+        ValueError: If data contains a character outside the Huffman table.
+    """
+    try:
+        symbols = data.encode("latin-1")
+    except UnicodeEncodeError as e:
+        raise ValueError(f"String {data!r} has characters outside the Huffman table.") from e
+    return (sum(map(_CODE_LENGTHS.__getitem__, symbols)) + 7) >> 3
+
 
 def encode(data: str) -> bytes:
     """
@@ -19,26 +42,20 @@ def encode(data: str) -> bytes:
 
     Returns:
         bytes: The Huffman encoded bytes.
+
+    Raises:
+        ValueError: If data contains a character outside the Huffman table.
     """
-    bit_buffer = 0
-    bit_count = 0
-    output = bytearray()
-
-    for ch in data:
-        symbol = ord(ch)
-        try:
-            code, nbits = HUFFMAN_TABLE[symbol]
-        except KeyError:
-            raise ValueError(
-                f"Symbol {ch} (code {symbol}) not in Huffman table.")
-        bit_buffer = (bit_buffer << nbits) | code
-        bit_count += nbits
-        while bit_count >= 8:
-            bit_count -= 8
-            byte = (bit_buffer >> bit_count) & 0xFF
-            output.append(byte)
-    if bit_count > 0:
-        # Pad the remaining bits with ones (all ones padding per spec)
-        pad = (1 << (8 - bit_count)) - 1
-        output.append(((bit_buffer << (8 - bit_count)) & 0xFF) | pad)
-    return bytes(output)
+    try:
+        symbols = data.encode("latin-1")
+    except UnicodeEncodeError as e:
+        ch = data[e.start]
+        raise ValueError(
+            f"Symbol {ch} (code {ord(ch)}) not in Huffman table.") from e
+    if not symbols:
+        return b""
+    bits = "".join(map(_CODE_BITS.__getitem__, symbols))
+    # Pad the remaining bits with ones (all ones padding per spec)
+    bits += "1" * (-len(bits) & 7)
+    return int(bits, 2).to_bytes(len(bits) >> 3, byteorder="big")
+
@@ -31,5 +31,5 @@ def decode_dynamic_table_size_update(data: bytes, pos: int) -> (int, int):
     # Check for the 3-bit prefix '001'
     if (first_byte >> 5) != 0b001:
         raise ValueError("Not a dynamic table size update instruction.")
-    new_max_size, n = decode_integer(data[pos:], 5)
+    new_max_size, n = decode_integer(data, 5, pos)
     return new_max_size, n
@@ -3,13 +3,17 @@ Literal Header Field Decoder for QPACK
 
 This module provides a function to decode a literal header field from a QPACK header block.
 It handles the flag byte, variable-length integer encoded lengths for the header name and value,
-and Huffman decoding of both.
+and the H bit of each length, which selects Huffman decoding or a raw string.
 """
 
 from typing import Tuple
 from .varint import decode_integer
 from .huffman import huffman_decode
 
+# H bits of the name (5-bit prefix) and value (7-bit prefix) length bytes.
+_NAME_HUFFMAN_FLAG = 0x20
+_VALUE_HUFFMAN_FLAG = 0x80
+
 
 def decode_literal(data: bytes, pos: int) -> Tuple[Tuple[str, str], int]:
     """
@@ -18,9 +22,11 @@ def decode_literal(data: bytes, pos: int) -> Tuple[Tuple[str, str], int]:
     Expected format:
       • 1 flag byte (indicating the literal representation type)
       • Header name length encoded as a variable-length integer with a 5-bit prefix,
-      • Huffman-encoded header name bytes,
+        with bit 0x20 (H) set if the name is Huffman-encoded,
+      • Header name bytes, Huffman-encoded or raw,
       • Header value length encoded as a variable-length integer with a 7-bit prefix,
-      • Huffman-encoded header value bytes.
+        with bit 0x80 (H) set if the value is Huffman-encoded,
+      • Header value bytes, Huffman-encoded or raw.
 
     Args:
         data (bytes): The QPACK header block data.
@@ -38,20 +44,26 @@ def decode_literal(data: bytes, pos: int) -> Tuple[Tuple[str, str], int]:
         raise ValueError("Insufficient data for literal header field.")
     pos += 1  # Consume flag.
     # Decode header name length with a 5-bit prefix.
-    name_length, n = decode_integer(data[pos:], 5)
+    if pos >= len(data):
+        raise ValueError("Insufficient data for literal header name.")
+    name_huffman = data[pos] & _NAME_HUFFMAN_FLAG
+    name_length, n = decode_integer(data, 5, pos)
     pos += n
     if pos + name_length > len(data):
         raise ValueError("Incomplete header name in literal field.")
     encoded_name = data[pos: pos + name_length]
     pos += name_length
-    name = huffman_decode(encoded_name)
+    name = huffman_decode(encoded_name) if name_huffman else encoded_name.decode("latin-1")
     # Decode header value length with a 7-bit prefix.
-    value_length, n = decode_integer(data[pos:], 7)
+    if pos >= len(data):
+        raise ValueError("Insufficient data for literal header value.")
+    value_huffman = data[pos] & _VALUE_HUFFMAN_FLAG
+    value_length, n = decode_integer(data, 7, pos)
     pos += n
     if pos + value_length > len(data):
         raise ValueError("Incomplete header value in literal field.")
     encoded_value = data[pos: pos + value_length]
     pos += value_length
-    value = huffman_decode(encoded_value)
+    value = huffman_decode(encoded_value) if value_huffman else encoded_value.decode("latin-1")
     return (name, value), (pos - start)
 
@@ -110,3 +110,10 @@ if len(STATIC_TABLE) != 99:
     raise RuntimeError(
         f"Static table incomplete; expected 99 entries but got {len(STATIC_TABLE)}.")
 
+
+# (lowercased name, value) -> 1-based static index, for O(1) lookups while encoding.
+# setdefault keeps the lowest index should a pair ever appear twice.
+STATIC_INDEX = {}
+for _index, (_name, _value) in enumerate(STATIC_TABLE, start=1):
+    STATIC_INDEX.setdefault((_name.lower(), _value), _index)
+del _index, _name, _value
@@ -3,9 +3,30 @@ Variable-Length Integer Encoding/Decoding for QPACK
 
 This module provides functions to encode and decode integers using
 the QPACK/HPACK variable-length integer encoding scheme.
+Encodings of values below 256 are precomputed for every prefix width, so the
+common short lengths and indexes are a single table lookup.
 """
 
 
+def _encode_integer(value: int, prefix_bits: int) -> bytes:
+    """Encode a non-negative integer with the prefix-and-continuation-bytes loop."""
+    prefix_max = (1 << prefix_bits) - 1
+    if value < prefix_max:
+        return bytes([value])
+    result = bytearray([prefix_max])
+    value -= prefix_max
+    while value >= 128:
+        result.append((value % 128) + 128)
+        value //= 128
+    result.append(value)
+    return bytes(result)
+
+
+# _SMALL_INTEGERS[prefix_bits][value] is the encoding of each value below 256.
+_SMALL_INTEGERS = [None] + [tuple(_encode_integer(value, prefix_bits) for value in range(256))
+                            for prefix_bits in range(1, 9)]
+
+
 def encode_integer(value: int, prefix_bits: int) -> bytes:
     """
     Encode an integer using QPACK's variable-length integer encoding.
@@ -20,27 +41,21 @@ def encode_integer(value: int, prefix_bits: int) -> bytes:
     Raises:
         ValueError: If the value is negative.
     """
+    if 0 <= value < 256 and 0 < prefix_bits <= 8:
+        return _SMALL_INTEGERS[prefix_bits][value]
     if value < 0:
         raise ValueError("Cannot encode a negative integer.")
-    prefix_max = (1 << prefix_bits) - 1
-    if value < prefix_max:
-        return bytes([value])
-    result = bytearray([prefix_max])
-    value -= prefix_max
-    while value >= 128:
-        result.append((value % 128) + 128)
-        value //= 128
-    result.append(value)
-    return bytes(result)
+    return _encode_integer(value, prefix_bits)
 
 
-def decode_integer(data: bytes, prefix_bits: int) -> (int, int):
+def decode_integer(data: bytes, prefix_bits: int, offset: int = 0) -> (int, int):
     """
     Decode an integer from the given data using QPACK's variable-length integer encoding.
 
     Args:
         data (bytes): The bytes containing the encoded integer.
         prefix_bits (int): The number of bits in the first byte reserved for the integer value.
+        offset (int): Position of the first byte in data, so callers need not slice.
 
     Returns:
         A tuple (value, bytes_consumed) where:
@@ -50,19 +65,19 @@ def decode_integer(data: bytes, prefix_bits: int) -> (int, int):
     Raises:
         ValueError: If the data is insufficient to decode the integer.
     """
-    if not data:
+    end = len(data)
+    if offset >= end:
         raise ValueError("Insufficient data to decode integer")
 
     prefix_max = (1 << prefix_bits) - 1
-    first_byte = data[0]
-    value = first_byte & prefix_max
+    value = data[offset] & prefix_max
     if value < prefix_max:
         return value, 1
 
     m = 0
-    index = 1
+    index = offset + 1
     while True:
-        if index >= len(data):
+        if index >= end:
             raise ValueError("Insufficient data while decoding integer")
         byte = data[index]
         index += 1
@@ -71,4 +86,4 @@ def decode_integer(data: bytes, prefix_bits: int) -> (int, int):
         if (byte & 0x80) == 0:
             break
 
-    return value, index
+    return value, index - offset
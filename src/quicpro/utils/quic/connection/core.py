@@ -45,7 +45,15 @@ class Connection:
             raise ConnectionError(f"Connection {self.connection_id} is not open")
         with self._lock:
             self.sent_packets.append(packet)
-        logger.debug("Connection %s sent packet: %s", self.connection_id, packet.hex())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Connection %s sent packet: %s", self.connection_id, packet.hex())
+
+    def send_packets(self, packets: List[bytes]) -> None:
+        if not self.is_open:
+            raise ConnectionError(f"Connection {self.connection_id} is not open")
+        with self._lock:
+            self.sent_packets.extend(packets)
+        logger.debug("Connection %s sent %d packets", self.connection_id, len(packets))
 
     def process_packet(self, packet: bytes) -> None:
         if not self.is_open:
@@ -53,7 +61,8 @@ class Connection:
         with self._cv:
             self.received_packets.append(packet)
             self._cv.notify_all()
-        logger.debug("Connection %s processed packet: %s", self.connection_id, packet.hex())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Connection %s processed packet: %s", self.connection_id, packet.hex())
 
     def receive_packet(self, timeout: float = 0.5) -> Optional[bytes]:
         with self._cv:
@@ -61,7 +70,8 @@ class Connection:
                 self._cv.wait(timeout=timeout)
             if self.received_packets:
                 packet = self.received_packets.pop(0)
-                logger.debug("Connection %s received packet: %s", self.connection_id, packet.hex())
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Connection %s received packet: %s", self.connection_id, packet.hex())
                 return packet
         logger.debug("Connection %s receive_packet timed out", self.connection_id)
         return None
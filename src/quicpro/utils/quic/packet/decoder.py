@@ -12,20 +12,36 @@ The production packet format is defined as follows:
 
 import hashlib
 import struct
+from typing import Union
 
 HEADER_MARKER = b'QUIC'
 
-def decode_quic_packet(packet: bytes) -> bytes:
-    if not packet.startswith(HEADER_MARKER):
+def decode_quic_packet(packet: Union[bytes, memoryview]) -> memoryview:
+    """
+    Decode a QUIC packet and return its stream frame payload.
+
+    The payload is returned as a memoryview into the packet rather than a
+    copy, so later pipeline stages can keep slicing without moving bytes.
+
+    Args:
+        packet (Union[bytes, memoryview]): The encoded QUIC packet.
+
+    Returns:
+        memoryview: The verified payload.
+
+    Raises:
+        ValueError: If the header, length or checksum is invalid.
+    """
+    view = memoryview(packet)
+    if view[:4] != HEADER_MARKER:
         raise ValueError("Packet does not start with the required header marker.")
-    if len(packet) < 16:
+    if len(view) < 16:
         raise ValueError("Packet too short to contain a valid header.")
-    payload_length = int.from_bytes(packet[4:8], byteorder='big')
-    checksum = packet[8:16]
-    if len(packet) < 16 + payload_length:
+    payload_length = int.from_bytes(view[4:8], byteorder='big')
+    if len(view) < 16 + payload_length:
         raise ValueError("Packet payload length mismatch.")
-    payload = packet[16:16+payload_length]
+    payload = view[16:16+payload_length]
     computed_checksum = hashlib.sha256(payload).digest()[:8]
-    if computed_checksum != checksum:
+    if computed_checksum != view[8:16]:
         raise ValueError("Checksum verification failed.")
     return payload
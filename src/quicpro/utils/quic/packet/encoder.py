@@ -11,9 +11,12 @@ The packet format is as follows:
 """
 
 import hashlib
+import struct
 
 HEADER_MARKER = b'QUIC'
 
+_pack_length = struct.Struct("!I").pack
+
 def encode_quic_packet(payload: bytes) -> bytes:
     """
     Encode a stream frame payload into a QUIC packet.
@@ -29,7 +32,6 @@ def encode_quic_packet(payload: bytes) -> bytes:
     """
     if not payload:
         raise ValueError("Payload cannot be empty.")
-    payload_length = len(payload)
-    length_bytes = payload_length.to_bytes(4, byteorder='big')
     checksum = hashlib.sha256(payload).digest()[:8]
-    return HEADER_MARKER + length_bytes + checksum + payload
+    # join() sizes the packet once instead of copying the payload on each concatenation.
+    return b"".join((HEADER_MARKER, _pack_length(len(payload)), checksum, payload))
@@ -10,7 +10,7 @@ and advanced QUIC features.
 import threading
 import time
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from quicpro.utils/quic.connection.core import Connection
 from quicpro.utils.quic.handshake_and_negotiation import QUICHandshake
@@ -80,7 +80,7 @@ class QUICManager:
     def receive_packet(self, packet: bytes) -> None:
         try:
             from quicpro.utils/quic.packet.decoder import decode_quic_packet
-            payload = decode_quic_packet(packet)
+            payload = bytes(decode_quic_packet(packet))
             from quicpro.utils/quic.header.header import Header
             header = Header.decode(payload)
             remaining = payload[len(header.encode()):]
@@ -104,6 +104,9 @@ class QUICManager:
     def send_packet(self, packet: bytes) -> None:
         self.connection.send_packet(packet)
 
+    def send_packets(self, packets: List[bytes]) -> None:
+        self.connection.send_packets(packets)
+
     def update_advanced_features(self, new_config: Dict[str, Any]) -> None:
         self.advanced_features = apply_advanced_features(new_config)
         logger.info("Advanced features updated: %s", self.advanced_features.dict())
@@ -1,15 +1,77 @@
 """
 Base TLS Handler for common initialization.
+In demo mode the AEAD is chosen from config.cipher: AES-256-GCM or
+ChaCha20-Poly1305, or "auto" to prefer ChaCha20-Poly1305 on CPUs without
+AES instructions, where software AES-GCM is much slower. config.backend
+"af_alg" runs AES-GCM in the Linux kernel instead of the cryptography package.
 """
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+import functools
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
+from quicpro.utils.tls2.af_alg_aead import AFALGAESGCM
+
+_AEAD_CIPHERS = {
+    "AES_256_GCM": AESGCM,
+    "CHACHA20_POLY1305": ChaCha20Poly1305,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def has_aes_acceleration() -> bool:
+    """
+    Return whether the CPU advertises AES instructions (x86 AES-NI or the ARMv8 aes feature).
+
+    Read from /proc/cpuinfo; where that is unavailable the CPU is assumed to have them.
+    """
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as cpuinfo:
+            for line in cpuinfo:
+                key, _, value = line.partition(":")
+                if key.strip().lower() in ("flags", "features"):
+                    return "aes" in value.split()
+    except OSError:
+        pass
+    return True
+
+
+def select_aead_cipher(cipher: str, backend: str = "cryptography"):
+    """Return the AEAD class for TLSConfig.cipher and TLSConfig.backend values, resolving "auto"."""
+    if cipher == "auto":
+        cipher = "AES_256_GCM" if has_aes_acceleration() else "CHACHA20_POLY1305"
+    if backend == "af_alg":
+        if cipher != "AES_256_GCM":
+            raise ValueError(f"The af_alg backend only supports AES_256_GCM, not {cipher!r}.")
+        return AFALGAESGCM
+    if backend != "cryptography":
+        raise ValueError(f"Unsupported demo backend: {backend!r}")
+    try:
+        return _AEAD_CIPHERS[cipher]
+    except KeyError:
+        raise ValueError(f"Unsupported demo cipher: {cipher!r}") from None
 
 class BaseTLSHandler:
-    def __init__(self, config, demo: bool, dtls_context: object = None) -> None:
+    def __init__(self, config, demo: bool, dtls_context: object = None,
+                 passthrough: bool = False) -> None:
+        """
+        Args:
+            config: TLSConfig holding the key, IV and demo cipher.
+            demo (bool): Use the built-in AEAD demo mode instead of a DTLS/TLS context.
+            dtls_context (object): The DTLS/TLS context used in real mode.
+            passthrough (bool): Demo mode only; keep the sequence-number framing
+                but skip encryption entirely, so packets travel as plaintext.
+        """
+        if passthrough and not demo:
+            raise ValueError("Passthrough is only available in demo mode.")
         self.config = config
         self.demo = demo
         self.dtls_context = dtls_context
+        self.passthrough = passthrough
         if self.demo:
-            self.aesgcm = AESGCM(self.config.key)
+            if passthrough:
+                self.aead = None
+            else:
+                aead_cipher = select_aead_cipher(getattr(self.config, "cipher", "AES_256_GCM"),
+                                                 getattr(self.config, "backend", "cryptography"))
+                self.aead = aead_cipher(self.config.key)
         else:
             if self.dtls_context is None:
                 raise ValueError("Real TLS mode requires a DTLS/TLS context.")
@@ -5,6 +5,8 @@ Helper functions for TLS modules.
 def compute_nonce(iv: bytes, seq_number: int) -> bytes:
     """
     Compute the nonce for AES-GCM by XORing the IV with the sequence number.
+
+    The XOR is done on integers rather than byte by byte. Callers that compute a nonce
+    per record should keep int.from_bytes(iv, "big") and XOR against that directly.
     """
-    seq_bytes = seq_number.to_bytes(12, byteorder="big")
-    return bytes(iv_byte ^ seq_byte for iv_byte, seq_byte in zip(iv, seq_bytes))
+    return (int.from_bytes(iv, byteorder="big") ^ seq_number).to_bytes(12, byteorder="big")
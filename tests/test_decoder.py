@@ -27,5 +27,27 @@ class TestDecoder(unittest.TestCase):
         self.decoder.decode(packet)
         self.assertEqual(self.consumer.messages, ["Unknown"])
 
+    """Test that a frame without a closing delimiter decodes to 'Unknown'."""
+    def test_decode_missing_closing_delimiter(self):
+        self.decoder.decode(b"HTTP3:Frame(Hello World")
+        self.assertEqual(self.consumer.messages, ["Unknown"])
+
+    """Test that a batch of packets is decoded in order."""
+    def test_decode_batch(self):
+        self.decoder.decode_batch([b"HTTP3:Frame(One)", b"Random Data", b"Frame(Two)"])
+        self.assertEqual(self.consumer.messages, ["One", "Unknown", "Two"])
+
+    """Test that memoryview packets take the same branches as bytes packets."""
+    def test_decode_memoryview(self):
+        packets = [b"HTTP3:Frame(One)", b"HTTP3:Frame(Two", b"Random Data"]
+        with self.assertLogs("quicpro.receiver.decoder", level="WARNING") as logs:
+            for packet in packets:
+                self.decoder.decode(memoryview(packet))
+            self.decoder.decode_batch(memoryview(packet) for packet in packets)
+        self.assertEqual(self.consumer.messages, ["One", "Unknown", "Unknown"] * 2)
+        self.assertEqual([record.getMessage() for record in logs.records],
+                         ["Closing delimiter not found; defaulting to 'Unknown'.",
+                          "Frame prefix not found; defaulting to 'Unknown'."] * 2)
+
 if __name__ == '__main__':
     unittest.main()
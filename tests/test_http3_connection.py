@@ -2,8 +2,12 @@
 """
 Test cases for HTTP3Connection class.
 """
+import struct
 import unittest
-from quicpro.utils.http3.connection.http3_connection import HTTP3Connection
+from quicpro.utils.http3.connection.http3_connection import (
+    HTTP3Connection, HTTP3ConnectionError, MAX_PENDING_RESPONSES, _encode_request_headers)
+from quicpro.utils.http3.qpack.decoder import QPACKDecoder
+from quicpro.utils.http3.streams.stream_manager import StreamManager
 from tests.test_utils.dummy_quic_manager import DummyQuicManager
 
 class TestHTTP3Connection(unittest.TestCase):
@@ -159,5 +163,171 @@ class TestHTTP3Connection(unittest.TestCase):
         self.assertIsNotNone(
             stream, "send_stream should be called once with custom stream_id.")
 
+def make_frame(frame_type: int, payload: bytes) -> bytes:
+    """Build a frame: 1-byte type, 2-byte big-endian payload length, payload."""
+    return struct.pack("!BH", frame_type, len(payload)) + payload
+
+def quic_payload(packet: bytes) -> bytes:
+    """Strip the 16-byte QUIC packet header (marker, length, checksum)."""
+    return packet[16:]
+
+class RecordingQuicManager:
+    """A QUIC manager that records sent packets and owns an HTTP/3 StreamManager."""
+    def __init__(self):
+        self.stream_manager = StreamManager()
+        self.sent_packets = []
+    def send_packet(self, packet: bytes) -> None:
+        self.sent_packets.append(packet)
+
+class BatchingQuicManager(RecordingQuicManager):
+    """A QUIC manager that also accepts a batch of packets in one call."""
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+    def send_packets(self, packets) -> None:
+        self.batches.append(list(packets))
+
+class TestHTTP3ConnectionRouting(unittest.TestCase):
+    """Test frame dispatch, response queueing and request sending of HTTP3Connection."""
+    def setUp(self):
+        self.manager = RecordingQuicManager()
+        self.connection = HTTP3Connection(self.manager)
+
+    def test_connection_frame_is_queued_whole(self):
+        self.connection.route_incoming_frame(make_frame(0x0D, b"keepalive"))
+        self.assertEqual(self.connection.receive_response(), b"keepalive")
+        self.assertEqual(self.manager.stream_manager.get_stream(0), None,
+                         "Connection-level frames should not be forwarded to a stream.")
+
+    def test_stream_frame_is_forwarded_to_stream(self):
+        self.connection.route_incoming_frame(make_frame(0x0A, struct.pack("!I", 5) + b"body"))
+        self.assertEqual(self.manager.stream_manager.get_stream(5).buffer, b"body")
+        self.assertEqual(self.connection.receive_response(), b"body")
+
+    def test_unknown_frame_type_uses_stream_layout(self):
+        self.connection.route_incoming_frame(make_frame(0x42, struct.pack("!I", 3) + b"x"))
+        self.assertEqual(self.manager.stream_manager.get_stream(3).buffer, b"x")
+
+    def test_handler_error_raises_connection_error(self):
+        with self.assertRaises(HTTP3ConnectionError):
+            self.connection.route_incoming_frame(make_frame(0x0B, b"\x00\x01"))
+        self.assertIsNone(self.connection.receive_response())
+
+    def test_incomplete_frame_raises(self):
+        with self.assertRaises(HTTP3ConnectionError):
+            self.connection.route_incoming_frame(make_frame(0x0D, b"ping")[:-1])
+        with self.assertRaises(HTTP3ConnectionError):
+            self.connection.route_incoming_frame(b"\x0d\x00")
+
+    def test_responses_are_returned_once_in_order(self):
+        for body in (b"one", b"two", b"three"):
+            self.connection.route_incoming_frame(make_frame(0x0A, struct.pack("!I", 1) + body))
+        self.assertEqual([self.connection.receive_response() for _ in range(4)],
+                         [b"one", b"two", b"three", None])
+
+    def test_response_queue_drops_oldest_when_full(self):
+        for index in range(MAX_PENDING_RESPONSES + 2):
+            self.connection.route_incoming_frame(make_frame(0x0D, b"%d" % index))
+        self.assertEqual(self.connection.receive_response(), b"2")
+
+    def test_response_does_not_reference_packet(self):
+        packet = bytearray(make_frame(0x0D, b"ping"))
+        self.connection.route_incoming_frame(packet)
+        packet[3:7] = b"XXXX"
+        self.assertEqual(self.connection.receive_response(), b"ping")
+
+    def test_stream_cache_skips_lookup_for_same_stream(self):
+        stream_manager = self.manager.stream_manager
+        lookups = []
+        get_stream = stream_manager.get_stream
+        stream_manager.get_stream = lambda stream_id: lookups.append(stream_id) or get_stream(stream_id)
+        for stream_id, body in ((1, b"a"), (1, b"b"), (2, b"c"), (1, b"d")):
+            self.connection.route_incoming_frame(make_frame(0x0A, struct.pack("!I", stream_id) + body))
+        self.assertEqual(lookups, [1, 2, 1])
+        self.assertEqual(get_stream(1).buffer, b"abd")
+        self.assertEqual(get_stream(2).buffer, b"c")
+
+    def test_stream_cache_drops_closed_stream(self):
+        frame = make_frame(0x0A, struct.pack("!I", 7) + b"data")
+        self.connection.route_incoming_frame(frame)
+        closed = self.manager.stream_manager.get_stream(7)
+        self.manager.stream_manager.close_stream(7)
+        self.connection.route_incoming_frame(frame)
+        reopened = self.manager.stream_manager.get_stream(7)
+        self.assertIsNot(reopened, closed)
+        self.assertEqual(reopened.buffer, b"data")
+
+    def test_close_clears_stream_cache(self):
+        self.connection.route_incoming_frame(make_frame(0x0A, struct.pack("!I", 1) + b"a"))
+        self.connection.close()
+        self.assertIsNone(self.connection._last_stream)
+
+    def test_send_request_default_headers(self):
+        self.connection.send_request(b"TestBody")
+        self.connection.send_request(b"TestBody")
+        self.assertEqual(len(self.manager.sent_packets), 2)
+        self.assertEqual(self.manager.sent_packets[0], self.manager.sent_packets[1])
+        payload = quic_payload(self.manager.sent_packets[0])
+        block_length = int.from_bytes(payload[:2], "big")
+        headers = QPACKDecoder().decode(payload[:2 + block_length])
+        self.assertEqual(headers[":authority"], "example.com")
+        self.assertEqual(payload[2 + block_length:], b"TestBody")
+
+    def test_default_header_block_is_encoded_once(self):
+        _encode_request_headers.cache_clear()
+        self.connection.send_request(b"one")
+        self.connection.send_request(b"two")
+        info = _encode_request_headers.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
+
+    def test_send_request_with_headers_reuses_dynamic_table(self):
+        headers = {":method": "POST", ":path": "/upload", "x-trace-id": "abc123"}
+        self.connection.send_request(b"a", headers=headers)
+        self.connection.send_request(b"b", headers=headers)
+        first, second = (quic_payload(packet) for packet in self.manager.sent_packets)
+        self.assertLess(len(second), len(first),
+                        "Repeated headers should be sent as dynamic table references.")
+        decoder = QPACKDecoder()
+        for payload in (first, second):
+            block_length = int.from_bytes(payload[:2], "big")
+            self.assertEqual(decoder.decode(payload[:2 + block_length]), headers)
+
+    def test_default_and_custom_requests_share_peer_table(self):
+        custom = {"x-custom": "one"}
+        self.connection.send_request(b"a", headers=custom)
+        self.connection.send_request(b"b")
+        self.connection.send_request(b"c", headers=custom)
+        self.connection.send_request_batch([b"d"])
+        self.connection.send_request(b"e", headers=custom)
+        decoder = QPACKDecoder()
+        decoded = []
+        for packet in self.manager.sent_packets:
+            payload = quic_payload(packet)
+            block_length = int.from_bytes(payload[:2], "big")
+            decoded.append(decoder.decode(payload[:2 + block_length]))
+        default = {":method": "GET", ":path": "/index.html", ":scheme": "https",
+                   ":authority": "example.com"}
+        self.assertEqual(decoded, [custom, default, custom, default, custom])
+        self.assertEqual(list(decoder.dynamic_table.entries), [("x-custom", "one")])
+
+    def test_send_request_with_custom_stream(self):
+        self.connection.send_request(b"TestBody", stream_id=42)
+        self.assertIsNotNone(self.manager.stream_manager.get_stream(42))
+
+    def test_send_request_batch_uses_send_packets(self):
+        manager = BatchingQuicManager()
+        connection = HTTP3Connection(manager)
+        connection.send_request_batch([b"one", b"two", b"three"])
+        self.assertEqual(len(manager.batches), 1)
+        self.assertEqual(manager.sent_packets, [])
+        connection.send_request(b"two")
+        self.assertEqual(manager.batches[0][1], manager.sent_packets[0],
+                         "A batched request should match the same request sent alone.")
+        self.assertEqual(len(list(manager.stream_manager)), 4)
+
+    def test_send_request_batch_falls_back_to_send_packet(self):
+        self.connection.send_request_batch([b"one", b"two"])
+        self.assertEqual(len(self.manager.sent_packets), 2)
+
 if __name__ == '__main__':
     unittest.main()
@@ -30,5 +30,23 @@ class TestReceiverPipeline(unittest.TestCase):
             http3_receiver = HTTP3Receiver(decoder=DummyDecoder(None))
             http3_receiver.receive(b"")
 
+    """Test that a batch of packets is delivered in order, one message per packet."""
+    def test_receive_batch(self):
+        messages = []
+        class CollectingDecoder:
+            def consume(self, message):
+                messages.append(message)
+        http3_receiver = HTTP3Receiver(decoder=CollectingDecoder())
+        packets = [len(block).to_bytes(2, "big") + block
+                   for block in (b"First", b"Second", b"Third")]
+        http3_receiver.receive_batch(packets)
+        self.assertEqual(messages, ["First", "Second", "Third"])
+
+    """Test that an invalid packet in a batch raises an HTTP3FrameError."""
+    def test_receive_batch_invalid_frame(self):
+        with self.assertRaises(HTTP3FrameError):
+            http3_receiver = HTTP3Receiver(decoder=DummyDecoder(None))
+            http3_receiver.receive_batch([b""])
+
 if __name__ == '__main__':
     unittest.main()
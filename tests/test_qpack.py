@@ -0,0 +1,321 @@
+"""
+Test module for the QPACK encoder and decoder.
+"""
+
+import random
+import unittest
+from quicpro.utils.http3.qpack.decoder import QPACKDecoder
+from quicpro.utils.http3.qpack.dynamic_table import DynamicTable, header_field_size
+from quicpro.utils.http3.qpack.encoder import (
+    HUFFMAN_MIN_LENGTH, NAME_HUFFMAN_FLAG, VALUE_HUFFMAN_FLAG, QPACKEncoder, _encode_string)
+from quicpro.utils.http3.qpack.huffman import huffman_decode, huffman_encode, huffman_encoded_length
+from quicpro.utils.http3.qpack.huffman.constants import HUFFMAN_TABLE
+from quicpro.utils.http3.qpack.huffman.decoder import build_decoding_tree
+from quicpro.utils.http3.qpack.literal_decoder import decode_literal
+from quicpro.utils.http3.qpack.static_table import STATIC_INDEX, STATIC_TABLE
+from quicpro.utils.http3.qpack.varint import _encode_integer, decode_integer, encode_integer
+
+# Long, lowercase ASCII compresses well under Huffman; NUL bytes have 13-bit codes and inflate.
+COMPRESSIBLE = "text/html; charset=utf-8; q=0.9"
+INFLATING = "\x00" * 25
+
+# Huffman-encoded strings from RFC 7541 Appendix C.4.
+RFC_HUFFMAN_VECTORS = [
+    ("www.example.com", "f1e3c2e5f23a6ba0ab90f4ff"),
+    ("no-cache", "a8eb10649cbf"),
+    ("custom-key", "25a849e95ba97d7f"),
+    ("custom-value", "25a849e95bb8e8b4bf"),
+]
+
+def random_latin1_strings(count, seed):
+    rng = random.Random(seed)
+    return ["".join(chr(rng.randrange(256)) for _ in range(rng.randrange(60)))
+            for _ in range(count)]
+
+def reference_huffman_encode(data):
+    """Encode bit by bit with a shift accumulator, as the original encoder did."""
+    bit_buffer, bit_count, output = 0, 0, bytearray()
+    for ch in data:
+        code, nbits = HUFFMAN_TABLE[ord(ch)]
+        bit_buffer = (bit_buffer << nbits) | code
+        bit_count += nbits
+        while bit_count >= 8:
+            bit_count -= 8
+            output.append((bit_buffer >> bit_count) & 0xFF)
+    if bit_count:
+        output.append(((bit_buffer << (8 - bit_count)) & 0xFF) | ((1 << (8 - bit_count)) - 1))
+    return bytes(output)
+
+class TestHuffmanEncoder(unittest.TestCase):
+    """Test the bit-string Huffman encoder."""
+    def test_rfc_vectors(self):
+        for text, expected in RFC_HUFFMAN_VECTORS:
+            self.assertEqual(huffman_encode(text).hex(), expected, text)
+
+    def test_matches_reference_encoder(self):
+        for text in random_latin1_strings(2000, seed=1):
+            self.assertEqual(huffman_encode(text), reference_huffman_encode(text), repr(text))
+
+    def test_encoded_length_matches_output(self):
+        for text in random_latin1_strings(500, seed=2):
+            self.assertEqual(huffman_encoded_length(text), len(huffman_encode(text)))
+
+    def test_empty_string(self):
+        self.assertEqual(huffman_encode(""), b"")
+
+    def test_non_latin1_raises(self):
+        with self.assertRaises(ValueError):
+            huffman_encode("a\u0100")
+        with self.assertRaises(ValueError):
+            huffman_encoded_length("a\u0100")
+
+def reference_huffman_decode(data):
+    """Walk the decoding tree one bit at a time, as the original decoder did."""
+    root = build_decoding_tree()
+    node, result, padding = root, [], True
+    for byte in data:
+        for shift in range(7, -1, -1):
+            bit = (byte >> shift) & 1
+            node = node[bit]
+            padding = padding and bit == 1
+            if "symbol" in node:
+                result.append(chr(node["symbol"]))
+                node, padding = root, True
+    if not padding:
+        raise ValueError("Invalid Huffman padding bits; expected all ones.")
+    return "".join(result)
+
+class TestHuffmanDecoder(unittest.TestCase):
+    """Test the nibble-table Huffman decoder."""
+    def test_rfc_vectors(self):
+        for text, encoded in RFC_HUFFMAN_VECTORS:
+            self.assertEqual(huffman_decode(bytes.fromhex(encoded)), text)
+
+    def test_round_trip(self):
+        for text in random_latin1_strings(2000, seed=3):
+            self.assertEqual(huffman_decode(huffman_encode(text)), text, repr(text))
+
+    def test_matches_reference_decoder(self):
+        rng = random.Random(4)
+        for text in random_latin1_strings(500, seed=5):
+            encoded = bytearray(huffman_encode(text))
+            if encoded:
+                # Flip one bit so invalid encodings are compared too.
+                encoded[rng.randrange(len(encoded))] ^= 1 << rng.randrange(8)
+            data = bytes(encoded)
+            try:
+                expected = reference_huffman_decode(data)
+            except (KeyError, ValueError):
+                with self.assertRaises(ValueError):
+                    huffman_decode(data)
+            else:
+                self.assertEqual(huffman_decode(data), expected)
+
+    def test_empty_input(self):
+        self.assertEqual(huffman_decode(b""), "")
+
+    def test_invalid_padding_raises(self):
+        with self.assertRaises(ValueError):
+            huffman_decode(b"\x00")
+        encoded = bytes.fromhex(RFC_HUFFMAN_VECTORS[0][1])
+        with self.assertRaises(ValueError):
+            huffman_decode(encoded[:-1] + b"\xfe")
+
+def linear_index_of(entries, name, value):
+    """Return the 1-based position of the first matching entry by scanning, or None."""
+    for position, (entry_name, entry_value) in enumerate(entries, start=1):
+        if entry_name.lower() == name.lower() and entry_value == value:
+            return position
+    return None
+
+class TestHeaderIndexes(unittest.TestCase):
+    """Test the dict indexes over the static and dynamic tables against linear scans."""
+    def test_static_index_matches_table(self):
+        for name, value in STATIC_TABLE:
+            for probe in (name, name.upper()):
+                self.assertEqual(STATIC_INDEX.get((probe.lower(), value)),
+                                 linear_index_of(STATIC_TABLE, probe, value))
+        self.assertIsNone(STATIC_INDEX.get(("x-custom", "")))
+
+    def test_dynamic_index_matches_linear_scan(self):
+        rng = random.Random(6)
+        names = ["x-a", "X-A", "x-b", "Cookie", "cookie", "x-long-" + "n" * 40]
+        values = ["", "1", "2", "v" * 60]
+        table = DynamicTable(max_size=400)
+        for _ in range(3000):
+            # Few distinct fields and a small capacity force duplicates and evictions.
+            table.add(rng.choice(names), rng.choice(values))
+            for _ in range(3):
+                name, value = rng.choice(names), rng.choice(values)
+                self.assertEqual(table.index_of(name, value),
+                                 linear_index_of(table.entries, name, value),
+                                 (name, value, list(table.entries)))
+
+    def test_evicted_entry_is_not_found(self):
+        table = DynamicTable(max_size=100)
+        table.add("x-a", "1")
+        table.add("x-b", "2")
+        table.add("x-c", "3")
+        self.assertIsNone(table.index_of("x-a", "1"))
+        self.assertEqual(table.index_of("X-B", "2"), 2)
+        self.assertEqual(table.index_of("x-c", "3"), 1)
+
+class TestDynamicTableSize(unittest.TestCase):
+    """Test the octet accounting of the dynamic table."""
+    def test_header_field_size(self):
+        self.assertEqual(header_field_size("x-a", "1"), 3 + 1 + 32)
+        self.assertEqual(header_field_size("", ""), 32)
+        # Non-ASCII text is counted in UTF-8 octets, not characters.
+        self.assertEqual(header_field_size("x-caf\xe9", "\u20ac"), 7 + 3 + 32)
+
+    def test_current_size_tracks_entries(self):
+        rng = random.Random(7)
+        table = DynamicTable(max_size=300)
+        for _ in range(2000):
+            name = rng.choice(["x-a", "X-B", "x-caf\xe9"])
+            value = "".join(rng.choice("ab\xe9\u20ac") for _ in range(rng.randrange(20)))
+            table.add(name, value)
+            self.assertEqual(table.current_size,
+                             sum(header_field_size(n, v) for n, v in table.entries))
+            self.assertLessEqual(table.current_size, table.max_size)
+
+    def test_oversized_field_raises(self):
+        table = DynamicTable(max_size=40)
+        with self.assertRaises(RuntimeError):
+            table.add("x-a", "v" * 10)
+
+class TestVarint(unittest.TestCase):
+    """Test the precomputed integer encodings against the encoding loop."""
+    def test_encode_matches_loop(self):
+        for prefix_bits in range(1, 9):
+            for value in range(5000):
+                self.assertEqual(encode_integer(value, prefix_bits),
+                                 _encode_integer(value, prefix_bits), (value, prefix_bits))
+
+    def test_round_trip_at_offset(self):
+        for prefix_bits in range(1, 9):
+            for value in list(range(300)) + [1 << 14, (1 << 21) + 5, (1 << 62) - 1]:
+                encoded = encode_integer(value, prefix_bits)
+                self.assertEqual(decode_integer(encoded, prefix_bits), (value, len(encoded)))
+                data = b"\xaa\xbb" + encoded + b"\xcc"
+                self.assertEqual(decode_integer(data, prefix_bits, 2), (value, len(encoded)))
+
+    def test_negative_value_raises(self):
+        for value in (-1, -300):
+            with self.assertRaises(ValueError):
+                encode_integer(value, 7)
+
+    def test_truncated_integer_raises(self):
+        with self.assertRaises(ValueError):
+            decode_integer(b"\x7f\x80", 7)
+        with self.assertRaises(ValueError):
+            decode_integer(b"\x01", 7, 1)
+
+class TestLiteralStrings(unittest.TestCase):
+    """Test the choice between raw and Huffman-encoded literal strings."""
+    def test_short_name_is_raw(self):
+        encoded = _encode_string("x-custom", 5, NAME_HUFFMAN_FLAG)
+        self.assertEqual(encoded, b"\x08x-custom")
+
+    def test_short_value_is_raw(self):
+        encoded = _encode_string("gzip", 7, VALUE_HUFFMAN_FLAG)
+        self.assertEqual(encoded, b"\x04gzip")
+
+    def test_long_compressible_name_is_huffman(self):
+        name = "x-" + COMPRESSIBLE.replace(" ", "-").replace(";", "").replace("/", "-")
+        encoded = _encode_string(name, 5, NAME_HUFFMAN_FLAG)
+        self.assertTrue(encoded[0] & NAME_HUFFMAN_FLAG, "The name H bit should be set.")
+        self.assertLess(len(encoded), len(name))
+        self.assertEqual(huffman_decode(encoded[1:]), name)
+
+    def test_long_compressible_value_is_huffman(self):
+        encoded = _encode_string(COMPRESSIBLE, 7, VALUE_HUFFMAN_FLAG)
+        self.assertTrue(encoded[0] & VALUE_HUFFMAN_FLAG, "The value H bit should be set.")
+        self.assertEqual(encoded[1:], huffman_encode(COMPRESSIBLE))
+
+    def test_inflating_value_is_raw(self):
+        self.assertGreaterEqual(len(INFLATING), HUFFMAN_MIN_LENGTH)
+        encoded = _encode_string(INFLATING, 7, VALUE_HUFFMAN_FLAG)
+        self.assertFalse(encoded[0] & VALUE_HUFFMAN_FLAG, "The value H bit should be clear.")
+        self.assertEqual(encoded, bytes([len(INFLATING)]) + INFLATING.encode("latin-1"))
+
+    def test_raw_strings_are_latin1(self):
+        self.assertEqual(_encode_string("caf\xe9", 7, VALUE_HUFFMAN_FLAG), b"\x04caf\xe9")
+
+    def test_non_latin1_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            _encode_string("€", 7, VALUE_HUFFMAN_FLAG)
+        with self.assertRaises(ValueError):
+            _encode_string("€" * HUFFMAN_MIN_LENGTH, 7, VALUE_HUFFMAN_FLAG)
+        with self.assertRaises(ValueError):
+            QPACKEncoder().encode({"x-price": "10€"})
+
+class TestLiteralDecoder(unittest.TestCase):
+    """Test that the H bits select Huffman or raw decoding."""
+    def test_raw_name_and_value(self):
+        data = b"\x00" + b"\x04name" + b"\x05value"
+        self.assertEqual(decode_literal(data, 0), (("name", "value"), len(data)))
+
+    def test_huffman_name_and_value(self):
+        name, value = huffman_encode("name"), huffman_encode("value")
+        data = (b"\x00" + bytes([NAME_HUFFMAN_FLAG | len(name)]) + name
+                + bytes([VALUE_HUFFMAN_FLAG | len(value)]) + value)
+        self.assertEqual(decode_literal(data, 0), (("name", "value"), len(data)))
+
+    def test_mixed_forms_at_offset(self):
+        value = huffman_encode(COMPRESSIBLE)
+        literal = b"\x10" + b"\x06cookie" + bytes([VALUE_HUFFMAN_FLAG | len(value)]) + value
+        data = b"\xff\xff" + literal
+        self.assertEqual(decode_literal(data, 2), (("cookie", COMPRESSIBLE), len(literal)))
+
+    def test_truncated_literal_raises(self):
+        with self.assertRaises(ValueError):
+            decode_literal(b"\x00\x04na", 0)
+
+class TestRoundTrip(unittest.TestCase):
+    """Test that encoded header blocks decode to the original headers."""
+    def setUp(self):
+        self.encoder = QPACKEncoder()
+        self.decoder = QPACKDecoder()
+
+    def round_trip(self, headers):
+        return self.decoder.decode(self.encoder.encode(headers))
+
+    def test_static_dynamic_and_literal_fields(self):
+        headers = {
+            ":method": "GET",
+            ":path": "/index.html",
+            ":authority": "example.com",
+            "user-agent": "Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101",
+            "x-binary": INFLATING,
+            "authorization": "Bearer abc",
+        }
+        for _ in range(3):
+            self.assertEqual(self.round_trip(headers), headers)
+
+    def test_repeated_headers_use_dynamic_references(self):
+        headers = {"x-request-id": "0123456789", "accept-language": "de-DE"}
+        first = self.encoder.encode(headers)
+        self.assertEqual(self.decoder.decode(first), headers)
+        second = self.encoder.encode(headers)
+        self.assertLess(len(second), len(first))
+        self.assertEqual(self.decoder.decode(second), headers)
+
+    def test_block_without_indexing_leaves_tables_untouched(self):
+        headers = {":method": "GET", ":authority": "example.com", "x-a": "1"}
+        # The encoder's table already holds x-a, but the block must not reference it.
+        self.encoder.encode({"x-a": "1"})
+        block = self.encoder.encode(headers, indexing=False)
+        self.assertEqual(block, QPACKEncoder().encode(headers, indexing=False))
+        self.assertEqual(self.decoder.decode(block), headers)
+        self.assertEqual(len(self.encoder.dynamic_table.entries), 1)
+        self.assertEqual(len(self.decoder.dynamic_table.entries), 0)
+
+    def test_auditing_encoder(self):
+        encoder = QPACKEncoder(auditing=True)
+        headers = {":method": "POST", "Content-Type": "application/json", "x-a": "1"}
+        for _ in range(3):
+            self.assertEqual(self.decoder.decode(encoder.encode(headers)), headers)
+
+if __name__ == '__main__':
+    unittest.main()
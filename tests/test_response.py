@@ -0,0 +1,32 @@
+"""
+Test module for the Response class.
+"""
+import unittest
+from quicpro.response import Response
+from quicpro.exceptions import HTTPStatusError
+
+class TestResponse(unittest.TestCase):
+    """Test cases for the Response class."""
+    def test_memoryview_content_is_not_copied(self):
+        """Test that a memoryview body is exposed through view without a copy."""
+        buffer = bytearray(b"xxHello World")
+        response = Response(200, memoryview(buffer)[2:])
+        self.assertEqual(response.text, "Hello World")
+        buffer[2:7] = b"Howdy"
+        self.assertEqual(bytes(response.view), b"Howdy World")
+        self.assertEqual(response.body, b"Howdy World")
+
+    def test_bytes_and_str_content(self):
+        """Test that bytes and str bodies produce the same content."""
+        self.assertEqual(Response(200, b"abc").body, b"abc")
+        self.assertEqual(Response(200, "abc").body, b"abc")
+        self.assertEqual(list(Response(200, memoryview(b"abcde")).iter_bytes(2)),
+                         [b"ab", b"cd", b"e"])
+
+    def test_raise_for_status(self):
+        """Test that error status codes raise an HTTPStatusError."""
+        with self.assertRaises(HTTPStatusError):
+            Response(500, b"").raise_for_status()
+
+if __name__ == '__main__':
+    unittest.main()
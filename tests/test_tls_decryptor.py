@@ -3,9 +3,10 @@ Test module for the TLSDecryptor.
 """
 
 import unittest
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 from quicpro.model.tls_config import TLSConfig
 from quicpro.exceptions import DecryptionError
+from quicpro.utils.tls2.af_alg_aead import af_alg_available
 
 class DummyQUICReceiver:
     def __init__(self):
@@ -33,6 +34,32 @@ class TestTLSDecryptor(unittest.TestCase):
         self.assertEqual(len(self.dummy_receiver.received_packets), 1, "One decrypted packet should be received.")
         self.assertEqual(self.dummy_receiver.received_packets[0], quic_packet, "Decrypted packet does not match the original.")
 
+    def test_decrypt_passthrough(self):
+        from quicpro.receiver.tls_decryptor import TLSDecryptor
+        decryptor = TLSDecryptor(quic_receiver=self.dummy_receiver, config=self.config, passthrough=True)
+        decryptor.decrypt((0).to_bytes(8, byteorder="big") + b"Plain QUIC Packet")
+        self.assertEqual(bytes(self.dummy_receiver.received_packets[0]), b"Plain QUIC Packet",
+                         "Passthrough mode should only strip the sequence number.")
+
+    def test_decrypt_chacha20_poly1305(self):
+        from quicpro.receiver.tls_decryptor import TLSDecryptor
+        config = TLSConfig(key=b"\x01" * 32, iv=b"\x02" * 12, cipher="CHACHA20_POLY1305")
+        decryptor = TLSDecryptor(quic_receiver=self.dummy_receiver, config=config)
+        ciphertext = ChaCha20Poly1305(config.key).encrypt(config.iv, b"Test QUIC Packet", None)
+        decryptor.decrypt((0).to_bytes(8, byteorder="big") + ciphertext)
+        self.assertEqual(self.dummy_receiver.received_packets[0], b"Test QUIC Packet",
+                         "ChaCha20-Poly1305 packets should decrypt with the configured cipher.")
+
+    @unittest.skipUnless(af_alg_available(), "Kernel AF_ALG gcm(aes) is not available.")
+    def test_decrypt_af_alg_backend(self):
+        from quicpro.receiver.tls_decryptor import TLSDecryptor
+        config = TLSConfig(key=b"\x01" * 32, iv=b"\x02" * 12, backend="af_alg")
+        decryptor = TLSDecryptor(quic_receiver=self.dummy_receiver, config=config)
+        ciphertext = AESGCM(config.key).encrypt(config.iv, b"Test QUIC Packet", None)
+        decryptor.decrypt((0).to_bytes(8, byteorder="big") + ciphertext)
+        self.assertEqual(self.dummy_receiver.received_packets[0], b"Test QUIC Packet",
+                         "The af_alg backend should produce the same AES-GCM output.")
+
     def test_decrypt_failure(self):
         with self.assertRaises(DecryptionError):
             # Provide an encrypted packet that is too short.
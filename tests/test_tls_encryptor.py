@@ -13,6 +13,21 @@ class DummyUDPSender:
     def send(self, packet: bytes) -> None:
         self.sent_packets.append(packet)
 
+class GatheringUDPSender:
+    def __init__(self):
+        self.sent_parts = []
+    def send(self, packet: bytes) -> None:
+        raise AssertionError("send_parts should be preferred over send")
+    def send_parts(self, parts) -> None:
+        self.sent_parts.append(tuple(parts))
+
+class BatchingUDPSender(DummyUDPSender):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+    def send_many(self, packets) -> None:
+        self.batches.append(list(packets))
+
 class FailingUDPSender:
     def send(self, packet: bytes) -> None:
         raise Exception("UDP send failure")
@@ -41,6 +56,86 @@ class TestTLSEncryptor(unittest.TestCase):
         decrypted = aesgcm.decrypt(nonce, ciphertext, None)
         self.assertEqual(decrypted, quic_packet, "Decrypted packet should match the original QUIC packet.")
 
+    def test_encrypt_passthrough(self):
+        encryptor = TLSEncryptor(udp_sender=self.dummy_udp_sender, config=self.config, demo=True, passthrough=True)
+        encryptor.encrypt(b"Test QUIC Packet")
+        self.assertEqual(self.dummy_udp_sender.sent_packets[0], (0).to_bytes(8, "big") + b"Test QUIC Packet",
+                         "Passthrough mode should only prepend the sequence number.")
+
+    def test_passthrough_requires_demo(self):
+        with self.assertRaises(ValueError):
+            TLSEncryptor(udp_sender=self.dummy_udp_sender, config=self.config, demo=False,
+                         dtls_context=object(), passthrough=True)
+
+    def test_encrypt_many(self):
+        packets = [b"first", b"second", b"third"]
+        self.encryptor.encrypt_many(packets)
+        single_sender = DummyUDPSender()
+        single = TLSEncryptor(udp_sender=single_sender, config=self.config, demo=True)
+        for packet in packets:
+            single.encrypt(packet)
+        self.assertEqual(self.dummy_udp_sender.sent_packets, single_sender.sent_packets,
+                         "A batch should produce the same records as single encrypt calls.")
+        self.assertEqual(self.encryptor._sequence_number, 3)
+
+    def test_encrypt_bulk(self):
+        payload = bytes(range(256)) * 10
+        self.encryptor.encrypt_bulk(payload, packet_size=1000)
+        aesgcm = AESGCM(self.config.key)
+        records = self.dummy_udp_sender.sent_packets
+        self.assertEqual(len(records), 3)
+        decrypted = b"".join(aesgcm.decrypt(self.encryptor._compute_nonce(n), record[8:], None)
+                             for n, record in enumerate(records))
+        self.assertEqual(decrypted, payload)
+
+    def test_compute_nonces_matches_single(self):
+        encryptor = TLSEncryptor(udp_sender=self.dummy_udp_sender,
+                                 config=TLSConfig(key=b"\x00" * 32, iv=bytes(range(12))), demo=True)
+        self.assertEqual(encryptor._compute_nonces(254, 3),
+                         [encryptor._compute_nonce(n) for n in (254, 255, 256)])
+
+    def test_encrypt_uses_send_parts(self):
+        sender = GatheringUDPSender()
+        encryptor = TLSEncryptor(udp_sender=sender, config=self.config, demo=True, passthrough=True)
+        encryptor.encrypt(b"one")
+        encryptor.encrypt_many([b"two"])
+        self.assertEqual(sender.sent_parts, [((0).to_bytes(8, "big"), b"one"),
+                                             ((1).to_bytes(8, "big"), b"two")])
+
+    def test_flush_every_buffers_records(self):
+        sender = BatchingUDPSender()
+        encryptor = TLSEncryptor(udp_sender=sender, config=self.config, demo=True,
+                                 passthrough=True, flush_every=2)
+        encryptor.encrypt(b"one")
+        self.assertEqual(sender.batches, [], "Records should wait until flush_every is reached.")
+        encryptor.encrypt(b"two")
+        encryptor.encrypt(b"ack", flush=True)
+        encryptor.encrypt_many([b"four", b"five"])
+        encryptor.flush()
+        self.assertEqual(sender.batches, [
+            [(0).to_bytes(8, "big") + b"one", (1).to_bytes(8, "big") + b"two"],
+            [(2).to_bytes(8, "big") + b"ack"],
+            [(3).to_bytes(8, "big") + b"four", (4).to_bytes(8, "big") + b"five"],
+        ])
+        self.assertEqual(sender.sent_packets, [])
+
+    def test_failed_batch_leaves_nothing_buffered(self):
+        sender = BatchingUDPSender()
+        encryptor = TLSEncryptor(udp_sender=sender, config=self.config, demo=True, passthrough=True)
+        with self.assertRaises(EncryptionError):
+            encryptor.encrypt_many([b"a", None, b"c"])
+        encryptor.encrypt_many([b"d"])
+        self.assertEqual(sender.batches, [[(2).to_bytes(8, "big") + b"d"]],
+                         "Records from a failed batch should not be sent later.")
+
+    def test_close_flushes_buffered_records(self):
+        sender = BatchingUDPSender()
+        with TLSEncryptor(udp_sender=sender, config=self.config, demo=True,
+                          passthrough=True, flush_every=4) as encryptor:
+            encryptor.encrypt(b"one")
+            self.assertEqual(sender.batches, [])
+        self.assertEqual(sender.batches, [[(0).to_bytes(8, "big") + b"one"]])
+
     def test_encrypt_failure(self):
         failing_udp_sender = FailingUDPSender()
         encryptor = TLSEncryptor(udp_sender=failing_udp_sender, config=self.config, demo=True)
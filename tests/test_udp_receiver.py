@@ -0,0 +1,93 @@
+"""
+Test module for UDPReceiver functionality.
+"""
+
+import socket
+import struct
+import threading
+import unittest
+from quicpro.receiver.udp_receiver import UDPReceiver, UDP_GRO, split_gro_segments
+
+class TestUDPReceiver(unittest.TestCase):
+    """Test cases for the UDPReceiver."""
+    def setUp(self):
+        self.received = []
+        self.all_received = threading.Event()
+        self.expected = 0
+
+    def _handler(self, data, addr):
+        self.received.append(data)
+        if len(self.received) >= self.expected:
+            self.all_received.set()
+
+    def test_receives_datagrams_in_order(self):
+        """Test that queued datagrams are drained and handled in arrival order."""
+        self.expected = 5
+        with UDPReceiver(("127.0.0.1", 0), packet_handler=self._handler,
+                         recv_batch_size=2) as receiver:
+            address = receiver._state["socket"].getsockname()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+                for i in range(self.expected):
+                    sender.sendto(b"packet-%d" % i, address)
+            self.assertTrue(self.all_received.wait(timeout=5))
+        self.assertEqual(self.received, [b"packet-%d" % i for i in range(5)])
+
+    def test_drain_socket_respects_batch_size(self):
+        """Test that a single drain reads at most recv_batch_size datagrams."""
+        receiver = UDPReceiver(("127.0.0.1", 0), packet_handler=self._handler,
+                               recv_batch_size=3)
+        receiver._create_and_bind_socket()
+        try:
+            address = receiver._state["socket"].getsockname()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+                for i in range(4):
+                    sender.sendto(b"x%d" % i, address)
+            receiver.selector.select(timeout=1)
+            first = receiver._drain_socket()
+            second = receiver._drain_socket()
+            self.assertEqual([data for data, _ in first], [b"x0", b"x1", b"x2"])
+            self.assertEqual([data for data, _ in second], [b"x3"])
+            self.assertEqual(receiver._drain_socket(), [])
+        finally:
+            receiver._cleanup_socket()
+            receiver._thread_state["executor"].shutdown(wait=True)
+
+    def test_receives_datagrams_with_gro_requested(self):
+        """Test that requesting GRO keeps datagrams intact whether or not it is available."""
+        self.expected = 3
+        with UDPReceiver(("127.0.0.1", 0), packet_handler=self._handler,
+                         gro=True) as receiver:
+            address = receiver._state["socket"].getsockname()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+                for i in range(self.expected):
+                    sender.sendto(b"gro-%d" % i, address)
+            self.assertTrue(self.all_received.wait(timeout=5))
+        self.assertEqual([bytes(data) for data in self.received],
+                         [b"gro-%d" % i for i in range(3)])
+
+    def test_batch_handler_receives_whole_batches(self):
+        """Test that a batch_handler is called with lists of (data, addr) pairs."""
+        self.expected = 4
+        batches = []
+        def batch_handler(batch):
+            batches.append(len(batch))
+            for data, addr in batch:
+                self._handler(data, addr)
+        with UDPReceiver(("127.0.0.1", 0), batch_handler=batch_handler) as receiver:
+            address = receiver._state["socket"].getsockname()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+                for i in range(self.expected):
+                    sender.sendto(b"batch-%d" % i, address)
+            self.assertTrue(self.all_received.wait(timeout=5))
+        self.assertEqual(self.received, [b"batch-%d" % i for i in range(4)])
+        self.assertEqual(sum(batches), 4)
+
+    def test_split_gro_segments(self):
+        """Test that a coalesced read is split at the reported segment size."""
+        ancdata = [(socket.IPPROTO_UDP, UDP_GRO, struct.pack("i", 4))]
+        segments = split_gro_segments(b"aaaabbbbcc", ancdata)
+        self.assertEqual([bytes(s) for s in segments], [b"aaaa", b"bbbb", b"cc"])
+        self.assertEqual(split_gro_segments(b"single", []), [b"single"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,10 +2,12 @@
 Test module for UDPSender functionality.
 """
 
+import socket
 import unittest
 import time
+from quicpro.sender.network import Network
 from quicpro.sender.udp_sender import UDPSender
-from quicpro.exceptions import TransmissionError
+from quicpro.exceptions import PartialTransmissionError, TransmissionError
 
 class DummyNetwork:
     """A dummy network that always succeeds in transmitting packets."""
@@ -27,6 +29,22 @@ class FailingNetwork:
         self.attempts += 1
         raise Exception("Transmission failed")
 
+class PartialBatchNetwork:
+    """A network whose first transmit_many() call fails after sending some datagrams."""
+    def __init__(self, fail_after=1):
+        self.fail_after = fail_after
+        self.sent = []
+        self.calls = 0
+    def transmit_many(self, datagrams) -> int:
+        self.calls += 1
+        datagrams = list(datagrams)
+        if self.calls == 1:
+            self.sent.extend(datagrams[:self.fail_after])
+            raise PartialTransmissionError("send failed", datagrams_sent=self.fail_after,
+                                           bytes_sent=sum(map(len, datagrams[:self.fail_after])))
+        self.sent.extend(datagrams)
+        return sum(map(len, datagrams))
+
 class FlakyNetwork:
     """A network that fails a given number of times before succeeding."""
     def __init__(self, fail_times=1, bytes_to_send=10):
@@ -65,6 +83,46 @@ class TestUDPSender(unittest.TestCase):
             sender.send(b"dummy packet")
         self.assertEqual(network.attempts, 3)
 
+    def test_send_parts_joins_without_transmit_parts(self):
+        """Test that send_parts falls back to one joined transmit() call."""
+        class RecordingNetwork(DummyNetwork):
+            def transmit(self, packet: bytes) -> int:
+                self.packet = packet
+                return super().transmit(packet)
+        network = RecordingNetwork()
+        sender = UDPSender(network=network, max_retries=0)
+        sender.send_parts((b"head", b"-tail"))
+        self.assertEqual(network.packet, b"head-tail")
+
+    def test_send_parts_gathers_one_datagram(self):
+        """Test that send_parts over a real Network arrives as a single datagram."""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.settimeout(5)
+            network = Network(server.getsockname())
+            with UDPSender(network=network, max_retries=0) as sender:
+                self.assertEqual(sender.send_parts((b"\x00" * 8, memoryview(b"payload"))), 15)
+                self.assertEqual(server.recv(64), b"\x00" * 8 + b"payload")
+
+    def test_send_many_sends_each_datagram(self):
+        """Test that send_many over a real Network sends one datagram per packet."""
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as server:
+            server.bind(("127.0.0.1", 0))
+            server.settimeout(5)
+            network = Network(server.getsockname())
+            with UDPSender(network=network, max_retries=0) as sender:
+                self.assertEqual(sender.send_many([b"first", b"second"]), 11)
+                self.assertEqual(server.recv(64), b"first")
+                self.assertEqual(server.recv(64), b"second")
+
+    def test_send_many_retries_only_unsent_datagrams(self):
+        """Test that a partial transmit_many() failure is retried from the first unsent datagram."""
+        network = PartialBatchNetwork(fail_after=2)
+        sender = UDPSender(network=network, max_retries=1, retry_delay=0)
+        self.assertEqual(sender.send_many([b"a", b"bb", b"ccc", b"dddd"]), 10)
+        self.assertEqual(network.sent, [b"a", b"bb", b"ccc", b"dddd"])
+        self.assertEqual(network.calls, 2)
+
     def test_context_manager(self):
         """Test that UDPSender context manager calls network.close() upon exit."""
         network = DummyNetwork()
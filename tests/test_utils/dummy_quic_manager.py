@@ -2,9 +2,15 @@
 """
 This module contains a dummy QUIC manager for testing purposes.
 """
+from quicpro.utils.http3.streams.stream_manager import StreamManager
 from tests.test_utils.dummy_connection import DummyConnection
 
 class DummyQuicManager:
     """A dummy QUIC manager that simulates a QUIC connection for testing purposes."""
     def __init__(self):
         self.connection = DummyConnection()
+        self.stream_manager = StreamManager()
+
+    """Send a packet over the dummy connection, which records it."""
+    def send_packet(self, packet: bytes) -> None:
+        self.connection.send_packet(packet)